@@ -2,80 +2,307 @@
 Account-level behavioral metrics for Chess Detective v2.1
 Non-accusatory, statistical analysis of player behavior.
 """
+import io
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from itertools import islice, repeat
+from typing import Any, Dict, Optional
+
+import chess
+import chess.pgn
+import numpy as np
 
 from .stats import (
     calculate_rating_progression,
-    calculate_move_time_patterns,
-    calculate_consistency_score,
+    MoveTimePatternAccumulator,
     detect_game_clustering,
+    parse_pgn_dates,
     calculate_opponent_strength_anomaly,
     calculate_rating_volatility,
-    analyze_opening_variety,
-    analyze_time_management
+    TimeManagementAccumulator,
+    OpeningVarietyAccumulator
 )
+from .utils.helpers import DATACLASS_SLOTS
 
-def analyze_account_behavior(games, username):
-    ratings = []
-    opponent_ratings = []
-    move_times = []
-    game_dates = []
-    accuracies = []
 
-    for game in games:
-        headers = game.headers
-        white = headers.get("White", "").lower()
-        black = headers.get("Black", "").lower()
+@dataclass(**DATACLASS_SLOTS)
+class AccountMetrics:
+    """
+    Result of analyze_account_behavior.
+
+    Metrics that could not be computed (too little data) stay None. The
+    read-only dict interface (get, [], in, keys) that callers used before
+    this was a dataclass is kept; None fields behave as missing keys.
+    """
+    rating_progression: Optional[Dict[str, Any]] = None
+    rating_volatility: Optional[Dict[str, Any]] = None
+    time_patterns: Optional[Dict[str, Any]] = None
+    opponent_strength_anomaly: Optional[float] = None
+    game_clustering: Optional[Dict[str, Any]] = None
+    time_management: Optional[Dict[str, Any]] = None
+    opening_variety: Optional[Dict[str, Any]] = None
+
+    def asdict(self) -> Dict[str, Any]:
+        """Return the computed metrics as a plain dict."""
+        return {f.name: getattr(self, f.name) for f in fields(self)
+                if getattr(self, f.name) is not None}
+
+    def keys(self):
+        return self.asdict().keys()
+
+    def get(self, key: str, default=None):
+        value = getattr(self, key) if key in self.__dataclass_fields__ else None
+        return default if value is None else value
+
+    def __getitem__(self, key: str):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+
+def _plain_headers(headers):
+    """
+    Snapshot a game's PGN headers as a plain dict.
+
+    chess.pgn.Headers resolves every lookup through Python-level
+    __getitem__; merging its two backing dicts once per game lets the
+    ~10 header reads below run as C dict lookups.
+    """
+    try:
+        return {**headers._tag_roster, **headers._others}
+    except AttributeError:
+        return dict(headers)
+
+# (player, opponent) Elo header keys, indexed by "is the player White?"
+_ELO_KEYS = {True: ("WhiteElo", "BlackElo"), False: ("BlackElo", "WhiteElo")}
+
+# Games handed to the process pool at a time when parsing PGN text in parallel
+PARALLEL_BATCH_SIZE = 500
+
+def _player_is_white(headers, username_lc):
+    """Return True/False for the player's side, or None if they did not play."""
+    if headers.get("White", "").lower() == username_lc:
+        return True
+    if headers.get("Black", "").lower() == username_lc:
+        return False
+    return None
+
+def _game_features(game, username_lc):
+    """
+    Return (headers, is_player_white, move_count) for a parsed game, or
+    None when the player took part on neither side.
+    """
+    headers = _plain_headers(game.headers)
+
+    # Decide participation before the (comparatively expensive) move walk
+    is_player_white = _player_is_white(headers, username_lc)
+    if is_player_white is None:
+        return None
+
+    # Move count proxy for time patterns (safe approximation).
+    # Follow the main line node links directly - no Move objects needed.
+    move_count = 0
+    node = game
+    while node.variations:
+        node = node.variations[0]
+        move_count += 1
+
+    return headers, is_player_white, move_count
+
+class _FeatureVisitor(chess.pgn.BaseVisitor):
+    """
+    PGN visitor collecting only headers and the main line ply count.
+
+    Account metrics never need a playable board, so SAN tokens are not
+    resolved: every main line move is recorded as a null move, which skips
+    the SAN parsing and attack generation that dominate read_game.
+    Variations are skipped outright.
+    """
+
+    def begin_game(self):
+        self.headers = {}
+        self.move_count = 0
+
+    def visit_header(self, tagname, tagvalue):
+        self.headers[tagname] = tagvalue
 
-        is_player_white = white == username.lower()
+    def begin_variation(self):
+        return chess.pgn.SKIP
+
+    def parse_san(self, board, san):
+        return chess.Move.null()
+
+    def visit_move(self, board, move):
+        self.move_count += 1
+
+    def result(self):
+        return self.headers, self.move_count
+
+def _pgn_features(pgn_text, username_lc):
+    """Process-pool worker: parse one PGN string and return its features."""
+    parsed = chess.pgn.read_game(io.StringIO(pgn_text), Visitor=_FeatureVisitor)
+    if parsed is None:
+        return None
+    headers, move_count = parsed
+
+    is_player_white = _player_is_white(headers, username_lc)
+    if is_player_white is None:
+        return None
+    return headers, is_player_white, move_count
+
+def _iter_game_features(games, username_lc, workers=None):
+    """
+    Yield (headers, is_player_white, move_count) for each game the player
+    took part in, in input order.
+
+    Games may be chess.pgn.Game objects or raw PGN strings. With workers > 1,
+    PGN strings are parsed in a process pool in batches of
+    PARALLEL_BATCH_SIZE; parsed games are always handled in-process since
+    shipping a node tree to a worker costs more than reading it.
+    """
+    if not workers or workers < 2:
+        for game in games:
+            if isinstance(game, str):
+                features = _pgn_features(game, username_lc)
+            else:
+                features = _game_features(game, username_lc)
+            if features is not None:
+                yield features
+        return
+
+    games = iter(games)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            batch = list(islice(games, PARALLEL_BATCH_SIZE))
+            if not batch:
+                break
+            pgn_texts = [game for game in batch if isinstance(game, str)]
+            parsed = executor.map(_pgn_features, pgn_texts, repeat(username_lc), chunksize=32)
+            for game in batch:
+                if isinstance(game, str):
+                    features = next(parsed)
+                else:
+                    features = _game_features(game, username_lc)
+                if features is not None:
+                    yield features
+
+def analyze_account_behavior(games, username, workers=None):
+    """
+    Compute account-level behavioral metrics for a player's games.
+
+    Args:
+        games: Iterable of chess.pgn.Game objects and/or PGN strings;
+            games the player did not take part in are skipped. The
+            iterable is consumed once, so a generator can stream games
+            without the whole corpus being held in memory
+        username: Player whose games are being analyzed
+        workers: Optional process count for parsing PGN strings in parallel
+
+    Returns:
+        AccountMetrics with the metrics that could be computed
+    """
+    # Typed int buffers; exposed to the stats functions as NumPy views below
+    ratings = array('i')
+    opponent_ratings = array('i')
+    move_times = MoveTimePatternAccumulator()
+    game_dates = []
+    time_management = TimeManagementAccumulator()
+    opening_variety = OpeningVarietyAccumulator()
+    username_lc = username.lower()
+
+    # Single pass over the games: every per-game feature is collected here so
+    # neither the game list nor any move list has to be walked a second time.
+    for headers, is_player_white, move_count in _iter_game_features(games, username_lc, workers):
+        time_management.update(headers)
+        opening_variety.update(headers)
 
         # Ratings
-        player_elo = headers.get("WhiteElo" if is_player_white else "BlackElo")
-        opponent_elo = headers.get("BlackElo" if is_player_white else "WhiteElo")
-
-        try:
-            if player_elo and opponent_elo:
-                ratings.append(int(player_elo))
-                opponent_ratings.append(int(opponent_elo))
-        except:
-            pass
-
-        # Dates
-        date = headers.get("Date")
-        if date:
+        player_elo_key, opponent_elo_key = _ELO_KEYS[is_player_white]
+        player_elo = headers.get(player_elo_key, "")
+        opponent_elo = headers.get(opponent_elo_key, "")
+
+        # Unrated games carry "?" or "-"; a digit check skips them without
+        # raising and catching a ValueError per game. Both ratings are
+        # required so the player and opponent series stay aligned.
+        if player_elo.isdecimal() and opponent_elo.isdecimal():
+            # Plain int() beats a hand-rolled digit loop for short Elo strings
+            ratings.append(int(player_elo))
+            opponent_ratings.append(int(opponent_elo))
+
+        # Dates ("????.??.??" placeholders never reach the bulk date parse)
+        date = headers.get("Date", "")
+        if date[:1].isdigit():
             game_dates.append(date)
 
-        # Move count proxy for time patterns (safe approximation)
-        move_count = len(list(game.mainline_moves()))
         if move_count > 0:
-            move_times.append(move_count)
+            move_times.update(move_count)
+
+    ratings = np.frombuffer(ratings, dtype=np.intc)
+    opponent_ratings = np.frombuffer(opponent_ratings, dtype=np.intc)
+    game_days = parse_pgn_dates(game_dates)
 
-    results = {}
+    results = AccountMetrics()
 
     # Rating volatility
-    if ratings:
-        results["rating_progression"] = calculate_rating_progression(ratings)
-        results["rating_volatility"] = calculate_rating_volatility(ratings)
+    if len(ratings):
+        results.rating_progression = calculate_rating_progression(ratings)
+        results.rating_volatility = calculate_rating_volatility(ratings)
 
     # Move time patterns
-    if move_times:
-        results["time_patterns"] = calculate_move_time_patterns(move_times)
+    if move_times.count:
+        results.time_patterns = move_times.finalize()
 
     # Opponent anomaly
-    if ratings and opponent_ratings:
-        results["opponent_strength_anomaly"] = calculate_opponent_strength_anomaly(
+    if len(ratings) and len(opponent_ratings):
+        results.opponent_strength_anomaly = calculate_opponent_strength_anomaly(
             ratings, opponent_ratings
         )
 
     # Game clustering
-    if game_dates:
-        results["game_clustering"] = detect_game_clustering(game_dates)
+    if len(game_days):
+        results.game_clustering = detect_game_clustering(game_days)
 
     # Time management analysis
-    if games:
-        results["time_management"] = analyze_time_management(games)
+    if time_management.game_count:
+        results.time_management = time_management.finalize()
 
     # Opening variety analysis
-    if games:
-        results["opening_variety"] = analyze_opening_variety(games)
+    if opening_variety.game_count:
+        results.opening_variety = opening_variety.finalize()
 
     return results
+
+def _analyze_account_job(job):
+    """Process-pool worker for analyze_accounts_batch."""
+    username, pgn_texts = job
+    return analyze_account_behavior(pgn_texts, username)
+
+def analyze_accounts_batch(jobs, workers=None):
+    """
+    Analyze several players' games, one process-pool task per player.
+
+    Args:
+        jobs: Mapping of username -> games (chess.pgn.Game objects or PGN
+            strings). Parsed games cannot be pickled reliably, so they are
+            exported to PGN text for the workers; pass raw PGN strings
+            where available to avoid that cost.
+        workers: Process count (default: CPU count). 1 analyzes in-process.
+
+    Returns:
+        Dictionary of username -> AccountMetrics
+    """
+    if workers == 1 or len(jobs) < 2:
+        return {username: analyze_account_behavior(games, username)
+                for username, games in jobs.items()}
+
+    payload = [
+        (username, [game if isinstance(game, str) else str(game) for game in games])
+        for username, games in jobs.items()
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(jobs, executor.map(_analyze_account_job, payload, chunksize=1)))
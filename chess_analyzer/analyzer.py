@@ -3,27 +3,236 @@ Core analysis logic for detecting fair play violations - ENHANCED DETECTIVE MODE
 """
 import chess
 import chess.pgn
+import hashlib
+import io
 import logging
-import statistics
+import os
 import math
-from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass
+import multiprocessing.util
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, List, NamedTuple, Tuple, Optional, Any
+from dataclasses import dataclass, field
 from datetime import datetime
 import json
 
+import numpy as np
+
 # Local imports
 from .engine import StockfishManager
+from .utils.helpers import DATACLASS_SLOTS, NUMBA_AVAILABLE, njit
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Phase boundaries for _game_loop
+OPENING_LAST_MOVE = 10  # Last full move counted as opening
+ENDGAME_MAX_PIECES = 6  # Max pawns + minor/major pieces (no queens/kings) in an endgame
+CRITICAL_SCORE_CP = 300  # |evaluation| beyond which a position is critical
+BLUNDER_CPL = 200  # Centipawn loss counted as a blunder
+
+
+def _game_loop(scores, piece_counts):
+    """
+    Per-game engine statistics in one pass.
+    
+    Args:
+        scores: float64 evaluations per analyzed move (NaN = no evaluation)
+        piece_counts: int32 piece count before each move that could be
+            placed on the main line (a prefix of scores)
+    
+    Returns:
+        (avg_cpl, blunder_count, opening_cpl, middlegame_cpl, endgame_cpl,
+        critical_cpl, critical_count); the phase values are mean absolute
+        evaluations and every mean is NaN for an empty sample
+    """
+    # CPL: each evaluation against the previous one negated for the
+    # opponent's perspective, skipping positions without an evaluation
+    cpl_total = 0.0
+    cpl_count = 0
+    blunder_count = 0
+    previous = 0.0
+    have_previous = False
+    for i in range(scores.shape[0]):
+        score = scores[i]
+        if np.isnan(score):
+            continue
+        if have_previous:
+            cpl = abs(score + previous)
+            cpl_total += cpl
+            cpl_count += 1
+            if cpl > BLUNDER_CPL:
+                blunder_count += 1
+        previous = score
+        have_previous = True
+    
+    # Phases: 0 opening, 1 middlegame, 2 endgame, 3 critical
+    totals = np.zeros(4)
+    counts = np.zeros(4, dtype=np.int64)
+    for i in range(piece_counts.shape[0]):
+        score = scores[i]
+        if np.isnan(score):
+            continue
+        if i // 2 + 1 <= OPENING_LAST_MOVE:
+            phase = 0
+        elif piece_counts[i] <= ENDGAME_MAX_PIECES:
+            phase = 2
+        else:
+            phase = 1
+        magnitude = abs(score)
+        totals[phase] += magnitude
+        counts[phase] += 1
+        if magnitude > CRITICAL_SCORE_CP:
+            totals[3] += magnitude
+            counts[3] += 1
+    
+    means = np.full(4, np.nan)
+    for phase in range(4):
+        if counts[phase]:
+            means[phase] = totals[phase] / counts[phase]
+    avg_cpl = cpl_total / cpl_count if cpl_count else np.nan
+    return avg_cpl, blunder_count, means[0], means[1], means[2], means[3], counts[3]
+
+
+def _game_masks(scores, piece_counts):
+    """
+    NumPy equivalent of _game_loop for when Numba is not installed.
+    
+    Phase membership is a boolean mask per phase instead of a Python-level
+    branch per move; inputs and return value are the same as _game_loop.
+    """
+    # CPL over consecutive evaluated positions
+    evaluated = scores[~np.isnan(scores)]
+    cpl = np.abs(evaluated[1:] + evaluated[:-1])
+    avg_cpl = float(cpl.mean()) if cpl.size else np.nan
+    blunder_count = int(np.count_nonzero(cpl > BLUNDER_CPL))
+    
+    phase_scores = scores[:piece_counts.shape[0]]
+    magnitudes = np.abs(phase_scores)
+    has_score = ~np.isnan(phase_scores)
+    move_numbers = np.arange(phase_scores.shape[0]) // 2 + 1
+    opening_mask = has_score & (move_numbers <= OPENING_LAST_MOVE)
+    endgame_mask = has_score & ~opening_mask & (piece_counts <= ENDGAME_MAX_PIECES)
+    middlegame_mask = has_score & ~(opening_mask | endgame_mask)
+    critical_mask = has_score & (magnitudes > CRITICAL_SCORE_CP)
+    
+    means = [float(magnitudes[mask].mean()) if mask.any() else np.nan
+             for mask in (opening_mask, middlegame_mask, endgame_mask, critical_mask)]
+    return (avg_cpl, blunder_count, means[0], means[1], means[2], means[3],
+            int(np.count_nonzero(critical_mask)))
+
+
+# fastmath is left off: it would let the compiler drop the NaN checks
+_game_kernel = njit(cache=True, nogil=True)(_game_loop) if NUMBA_AVAILABLE else _game_masks
+
+
+def _phase_accuracy(avg_phase_cpl: float) -> float:
+    """Accuracy (0-100) from a phase's mean absolute evaluation; 0.0 for no data."""
+    if math.isnan(avg_phase_cpl):
+        return 0.0
+    accuracy = 100 - min(avg_phase_cpl / 2, 100) if avg_phase_cpl < 200 else 50.0
+    # Conditional clamp: no min()/max() calls on the per-phase path
+    return 100.0 if accuracy > 100.0 else (0.0 if accuracy < 0.0 else accuracy)
+
+
+# GameAnalysis.result codes, from White's side of the PGN Result tag
+RESULT_UNKNOWN = -1
+RESULT_LOSS = 0
+RESULT_DRAW = 1
+RESULT_WIN = 2
+_RESULT_CODES = {'1-0': RESULT_WIN, '1/2-1/2': RESULT_DRAW, '0-1': RESULT_LOSS}
+
+# Below this many move times, ChessAnalyzer._calculate_move_time_consistency
+# buckets a list with collections.Counter instead of np.bincount
+MOVE_TIME_BINCOUNT_MIN = 32
+
+# Recommendation bands by suspicion score: a score below _RISK_BAND_THRESHOLDS[i]
+# (and at or above the previous threshold) gets _RISK_BAND_MESSAGES[i]
+_RISK_BAND_THRESHOLDS = (40, 70)
+_RISK_BAND_MESSAGES = (
+    ("✅ LOW RISK: No strong indicators detected.",),
+    ("⚠️ MODERATE RISK: Some suspicious patterns detected.",
+     "Review games with highest engine correlation individually."),
+    ("⚠️ HIGH RISK: Player shows multiple strong indicators of potential assistance.",
+     "Recommend detailed manual review of games with >95% engine correlation."),
+)
+
+# Estimated rating walk in ChessAnalyzer._analyze_rating_progression
+ELO_K_FACTOR = 32  # Points per win/loss
+RATING_JUMP_THRESHOLD = 50  # Game-to-game change flagged as a jump
+
+def _decode_results(game_analyses) -> np.ndarray:
+    """
+    Result codes (RESULT_*) for each game as an int8 array.
+
+    GameAnalysis.result is already decoded at ingest; only games left
+    RESULT_UNKNOWN (including ones the engine failed on) fall back to the
+    metadata 'result' string, so their real result is still counted.
+    """
+    codes = _RESULT_CODES
+    return np.fromiter(
+        (ga.result if ga.result != RESULT_UNKNOWN
+         else codes.get(ga.metadata.get('result', '?'), RESULT_UNKNOWN)
+         for ga in game_analyses),
+        dtype=np.int8, count=len(game_analyses)
+    )
+
+# Elo expected score 1 / (1 + 10^(-diff/400)), written in logistic form
+# 1 / (1 + e^(-k*diff)) with k = ln(10)/400: one exp() instead of a pow()
+_ELO_LOGISTIC_K = math.log(10) / 400
+
+def _elo_logistic(rating_diff: float) -> float:
+    """Expected score (0-1) for a rating difference."""
+    return 1.0 / (1.0 + math.exp(-_ELO_LOGISTIC_K * rating_diff))
+
+DEFAULT_ELO = 1600  # Rating assumed when a game has no usable Elo tag
+
+def _header_elo(headers: Dict[str, str], key: str) -> int:
+    """Parse an Elo header; unrated values such as "?" or "-" give DEFAULT_ELO."""
+    value = headers.get(key, '')
+    return int(value) if value.isdecimal() else DEFAULT_ELO
+
+def _fmean(values) -> float:
+    """Float mean (0.0 for no values); statistics.mean is exact but goes through Fraction."""
+    return math.fsum(values) / len(values) if values else 0.0
+
+
+def game_id_for(game: chess.pgn.Game) -> str:
+    """
+    Identifier of a game (GameAnalysis.game_id) from its headers and main line.
+
+    The same game gives the same ID after a PGN export and re-parse, as in
+    the process-pool workers.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for key, value in sorted(game.headers.items()):
+        digest.update(f"{key}\0{value}\0".encode())
+    digest.update(" ".join(move.uci() for move in game.mainline_moves()).encode())
+    return digest.hexdigest()
+
+
+class SuspiciousMove(NamedTuple):
+    """An engine-matching move played in a non-critical position."""
+    move_number: int
+    move: str
+    best_move: str
+    score_cp: int
+
+@dataclass(**DATACLASS_SLOTS)
 class GameAnalysis:
-    """Analysis results for a single game."""
-    game: chess.pgn.Game
+    """
+    Analysis results for a single game.
+    
+    The parsed game is not kept, only a copy of its headers and its
+    game_id (see game_id_for), so analyses do not keep whole move trees
+    alive; look the game up by game_id in the caller's own games.
+    """
     engine_correlation: float  # Percentage of moves matching engine's top choice
     avg_centipawn_loss: float  # Average centipawn loss per move (lower = stronger)
     accuracy_score: float  # Derived accuracy percentage
-    suspicious_moves: List[Dict]  # Moves that look suspicious
+    suspicious_moves: List[SuspiciousMove]  # Moves that look suspicious
     time_controls: Dict[str, Any]
     analysis_time: float
     metadata: Dict[str, Any]
@@ -41,26 +250,70 @@ class GameAnalysis:
     # Modern detector metrics
     move_time_consistency: float = 0.0  # How consistent are move times (0-100, high = suspicious)
     probability_correlation: float = 0.0  # Likelihood of finding best moves (modern chess.com metric)
-    win_loss_rate: float = 0.0  # Win percentage
-    draw_rate: float = 0.0  # Draw percentage
-    loss_rate: float = 0.0  # Loss percentage
+    result: int = RESULT_UNKNOWN  # Game result code (RESULT_* constants)
     superhuman_score: float = 0.0  # IM+ level indicator (0-100)
     rating_differential_score: float = 0.0  # Performance vs opponent ratings
     
+    # PGN headers and identifier of the analyzed game, with the Elo tags parsed once
+    headers: Dict[str, str] = field(default_factory=dict)
+    game_id: str = ""
+    white_elo: int = field(default=DEFAULT_ELO, init=False)
+    black_elo: int = field(default=DEFAULT_ELO, init=False)
+    
+    # Memoized is_suspicious (slotted instances have no __dict__ for cached_property)
+    _is_suspicious: Optional[bool] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.white_elo = _header_elo(self.headers, 'WhiteElo')
+        self.black_elo = _header_elo(self.headers, 'BlackElo')
+    
+    @property
+    def win_loss_rate(self) -> float:
+        """Win score (1.0 win, 0.5 draw, 0.0 loss/unknown)."""
+        if self.result == RESULT_WIN:
+            return 1.0
+        return 0.5 if self.result == RESULT_DRAW else 0.0
+    
+    @property
+    def draw_rate(self) -> float:
+        """1.0 for a draw, else 0.0."""
+        return 1.0 if self.result == RESULT_DRAW else 0.0
+    
+    @property
+    def loss_rate(self) -> float:
+        """1.0 for a loss, else 0.0."""
+        return 1.0 if self.result == RESULT_LOSS else 0.0
+    
     @property
     def is_suspicious(self) -> bool:
-        """Check if game shows suspicious patterns - MODERN DETECTION."""
+        """
+        Check if game shows suspicious patterns - MODERN DETECTION.
+        
+        Computed once on first access; analysis fields are not changed
+        after construction.
+        """
+        if self._is_suspicious is None:
+            self._is_suspicious = self._check_suspicious()
+        return self._is_suspicious
+    
+    def _check_suspicious(self) -> bool:
+        """Evaluate the suspicious-game predicates."""
+        # Ordered so `or` short-circuits as early as possible. Any game with a
+        # few engine-matching quiet moves already trips the first check, so
+        # it comes first. The timing and probability checks come last: as
+        # computed in this module, move_time_consistency tops out at 60 and
+        # probability_correlation at 70, so those two never fire today.
         return (
+            len(self.suspicious_moves) > 5 or  # Multiple suspicious moves
             self.engine_correlation > 95.0 or  # Too many engine moves
             self.avg_centipawn_loss < 10.0 or  # Too few mistakes
-            len(self.suspicious_moves) > 5 or  # Multiple suspicious moves
             self.critical_move_accuracy > 98.0 or  # Too perfect in critical positions
             self.opening_accuracy > 99.0 or  # Perfect opening play
             self.move_time_consistency > 85.0 or  # Engine-like timing
             self.probability_correlation > 94.0  # Statistical impossibility
         )
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PlayerAnalysis:
     """Aggregated analysis results for a player."""
     username: str
@@ -99,6 +352,10 @@ class PlayerAnalysis:
     avg_superhuman_score: float = 0.0  # IM+ level indicator
     rating_differential_anomaly: float = 0.0  # Performance vs opponents
     avg_time_scramble_accuracy: float = 0.0  # Accuracy in time pressure
+    analysis_time: float = 0.0  # Total engine analysis time (seconds)
+    
+    # Memoized suspicion_score (slotted instances have no __dict__ for cached_property)
+    _suspicion_score: Optional[float] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.rating_jump_detection is None:
@@ -108,53 +365,77 @@ class PlayerAnalysis:
     
     @property
     def suspicion_score(self) -> float:
+        """
+        Overall suspicion score (0-100) - MODERN DETECTION.
+        
+        Computed once on first access; call invalidate_scores() after
+        changing any field the score reads.
+        """
+        if self._suspicion_score is None:
+            self._suspicion_score = self._calculate_suspicion_score()
+        return self._suspicion_score
+    
+    def _calculate_suspicion_score(self) -> float:
         """Calculate overall suspicion score (0-100) - MODERN DETECTION."""
-        if self.games_analyzed == 0:
+        games_analyzed = self.games_analyzed
+        if games_analyzed == 0:
             return 0.0
         
+        # Each field is read once into a local; the weights and thresholds
+        # below are plain literals, so the rest is straight-line arithmetic
+        engine_correlation = self.avg_engine_correlation
+        centipawn_loss = self.avg_centipawn_loss
+        consistency = self.accuracy_consistency
+        probability_correlation = self.avg_probability_correlation
+        move_time_consistency = self.avg_move_time_consistency
+        critical_handling = self.critical_position_handling
+        superhuman = self.avg_superhuman_score
+        opening_prep = self.opening_preparation_score
+        
         score = 0.0
         
         # Engine correlation weight: 22%
-        if self.avg_engine_correlation > 90:
-            score += 22 * (self.avg_engine_correlation - 90) / 10
+        if engine_correlation > 90:
+            score += 22 * (engine_correlation - 90) / 10
         
         # Centipawn loss weight: 16%
-        if self.avg_centipawn_loss < 20:
-            score += 16 * (20 - self.avg_centipawn_loss) / 20
+        if centipawn_loss < 20:
+            score += 16 * (20 - centipawn_loss) / 20
         
         # Consistency weight: 10%
-        if self.accuracy_consistency < 15:
-            score += 10 * (15 - self.accuracy_consistency) / 15
+        if consistency < 15:
+            score += 10 * (15 - consistency) / 15
         
         # MODERN: Probability correlation: 15%
-        if self.avg_probability_correlation > 80:
-            score += 15 * min(1.0, (self.avg_probability_correlation - 80) / 20)
+        if probability_correlation > 80:
+            score += 15 * min(1.0, (probability_correlation - 80) / 20)
         
         # MODERN: Move time consistency (engine-like timing): 12%
-        if self.avg_move_time_consistency > 70:
-            score += 12 * min(1.0, (self.avg_move_time_consistency - 70) / 30)
+        if move_time_consistency > 70:
+            score += 12 * min(1.0, (move_time_consistency - 70) / 30)
         
         # Extremely accurate games: 8%
-        extremely_accurate_ratio = self.extremely_accurate_games / max(1, self.games_analyzed)
+        extremely_accurate_ratio = self.extremely_accurate_games / max(1, games_analyzed)
         score += 8 * min(1.0, extremely_accurate_ratio)
         
         # Critical position handling: 8%
-        if self.critical_position_handling > 95:
-            score += 8 * (self.critical_position_handling - 95) / 5
+        if critical_handling > 95:
+            score += 8 * (critical_handling - 95) / 5
         
         # MODERN: Superhuman performance: 6%
-        if self.avg_superhuman_score > 60:
-            score += 6 * min(1.0, (self.avg_superhuman_score - 60) / 40)
+        if superhuman > 60:
+            score += 6 * min(1.0, (superhuman - 60) / 40)
         
         # Opening preparation: 5%
-        if self.opening_preparation_score > 85:
-            score += 5 * (self.opening_preparation_score - 85) / 15
+        if opening_prep > 85:
+            score += 5 * (opening_prep - 85) / 15
         
         # Win rate anomaly: 3%
         score += 3 * min(1.0, self.win_rate_anomaly / 50)
         
         # Rating jump detection: 2%
-        rating_jump_score = len(self.rating_jump_detection) * 20 if self.rating_jump_detection else 0
+        rating_jumps = self.rating_jump_detection
+        rating_jump_score = len(rating_jumps) * 20 if rating_jumps else 0
         score += 2 * min(1.0, rating_jump_score / 100)
         
         # Move time suspicion: 2%
@@ -162,6 +443,10 @@ class PlayerAnalysis:
         
         return min(100.0, score)
     
+    def invalidate_scores(self) -> None:
+        """Drop the cached suspicion_score (and so risk_level) so it is recomputed."""
+        self._suspicion_score = None
+    
     @property
     def risk_level(self) -> str:
         """Get risk level based on suspicion score."""
@@ -228,29 +513,35 @@ class ChessAnalyzer:
         total_analysis_time = 0.0
         analyzed_count = 0
         
-        # Analyze each game
-        for i, game in enumerate(games, 1):
-            logger.info(f"Analyzing game {i}/{len(games)}")
-            print(f"  [{i}/{len(games)}] Analyzing...", end="\r")
-            
-            try:
-                game_analysis = self._analyze_single_game(game)
-                game_analyses.append(game_analysis)
-                total_analysis_time += game_analysis.analysis_time
-                analyzed_count += 1
-                
-                logger.info(f"  Game {i}: {game_analysis.engine_correlation:.1f}% engine correlation, "
-                           f"{game_analysis.avg_centipawn_loss:.1f} avg CPL")
+        analysis_config = self.config.get('analysis', {})
+        if analysis_config.get('parallel', False) and len(games) > 1:
+            game_analyses = self._analyze_games_parallel(games, analysis_config.get('workers'))
+            total_analysis_time = sum(ga.analysis_time for ga in game_analyses)
+            analyzed_count = len(game_analyses)
+        else:
+            # Analyze each game
+            for i, game in enumerate(games, 1):
+                logger.info(f"Analyzing game {i}/{len(games)}")
+                print(f"  [{i}/{len(games)}] Analyzing...", end="\r")
                 
-            except KeyboardInterrupt:
-                print(f"\n\nAnalysis interrupted by user.")
-                logger.warning(f"Analysis interrupted at game {i}")
-                break
-            except Exception as e:
-                logger.error(f"Failed to analyze game {i}: {e}")
-                print(f"  [{i}/{len(games)}] Error: {str(e)[:30]}")
-                continue
-        
+                try:
+                    game_analysis = self._analyze_single_game(game)
+                    game_analyses.append(game_analysis)
+                    total_analysis_time += game_analysis.analysis_time
+                    analyzed_count += 1
+                    
+                    logger.info(f"  Game {i}: {game_analysis.engine_correlation:.1f}% engine correlation, "
+                               f"{game_analysis.avg_centipawn_loss:.1f} avg CPL")
+                    
+                except KeyboardInterrupt:
+                    print(f"\n\nAnalysis interrupted by user.")
+                    logger.warning(f"Analysis interrupted at game {i}")
+                    break
+                except Exception as e:
+                    logger.error(f"Failed to analyze game {i}: {e}")
+                    print(f"  [{i}/{len(games)}] Error: {str(e)[:30]}")
+                    continue
+            
         print()  # Clear the progress line
         
         # Aggregate results
@@ -280,7 +571,87 @@ class ChessAnalyzer:
             logger.warning("No games could be analyzed")
         
         return player_analysis
+
+    def analyze_players(self, jobs: Dict[str, List[Any]],
+                        workers: Optional[int] = None) -> Dict[str, PlayerAnalysis]:
+        """
+        Analyze several players' games, one process-pool task per player.
+        
+        Args:
+            jobs: Mapping of username -> games (chess.pgn.Game objects or PGN
+                strings). Workers receive PGN text, so pass raw strings where
+                available to skip exporting parsed games.
+            workers: Process count (default: CPU count). 1 analyzes in-process.
+        
+        Returns:
+            Dictionary of username -> PlayerAnalysis
+        """
+        if workers == 1 or len(jobs) < 2:
+            return {username: self.analyze_games(_parse_games(games))
+                    for username, games in jobs.items()}
+        
+        # Players already run in parallel; a nested per-game pool would
+        # oversubscribe the machine
+        config = json.loads(json.dumps(self.config, default=str))
+        config.setdefault('analysis', {})['parallel'] = False
+        config_key = json.dumps(config, sort_keys=True)
+        
+        workers = min(workers or os.cpu_count() or 1, len(jobs))
+        logger.info(f"Analyzing {len(jobs)} players with {workers} worker processes")
+        payload = [[game if isinstance(game, str) else str(game) for game in games]
+                   for games in jobs.values()]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(jobs, executor.map(_analyze_player, payload,
+                                               [config_key] * len(payload))))
     
+    def _analyze_games_parallel(self, games: List[chess.pgn.Game],
+                                workers: Optional[int] = None) -> List[GameAnalysis]:
+        """
+        Analyze games in a process pool, one engine per worker process.
+
+        Args:
+            games: List of games to analyze
+            workers: Process count (default: CPU count)
+
+        Returns:
+            GameAnalysis list in input order (failed games are left out)
+        """
+        workers = min(workers or os.cpu_count() or 1, len(games))
+        config_key = json.dumps(self.config, sort_keys=True, default=str)
+        results: List[Optional[GameAnalysis]] = [None] * len(games)
+        logger.info(f"Analyzing {len(games)} games with {workers} worker processes")
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Game trees are not reliably picklable, so workers get PGN text
+            futures = {
+                executor.submit(_analyze_one, str(game), config_key): index
+                for index, game in enumerate(games)
+            }
+            done = 0
+            try:
+                for future in as_completed(futures):
+                    index = futures[future]
+                    done += 1
+                    print(f"  [{done}/{len(games)}] Analyzing...", end="\r")
+
+                    try:
+                        game_analysis = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to analyze game {index + 1}: {e}")
+                        print(f"  [{done}/{len(games)}] Error: {str(e)[:30]}")
+                        continue
+
+                    results[index] = game_analysis
+                    logger.info(f"  Game {index + 1}: {game_analysis.engine_correlation:.1f}% engine correlation, "
+                               f"{game_analysis.avg_centipawn_loss:.1f} avg CPL")
+            except KeyboardInterrupt:
+                print(f"\n\nAnalysis interrupted by user.")
+                logger.warning(f"Analysis interrupted after {done} games")
+                for future in futures:
+                    future.cancel()
+
+        return [ga for ga in results if ga is not None]
+
     def _analyze_single_game(self, game: chess.pgn.Game) -> GameAnalysis:
         """
         Analyze a single chess game - ENHANCED DETECTIVE MODE.
@@ -295,9 +666,6 @@ class ChessAnalyzer:
         start_time = time.time()
         
         try:
-            # Get game metadata
-            metadata = self._extract_game_metadata(game)
-            
             # Analyze with engine
             engine_analysis = self.engine_manager.analyze_game(game)
             
@@ -305,75 +673,70 @@ class ChessAnalyzer:
             if 'error' in engine_analysis:
                 logger.warning(f"Engine analysis failed, returning minimal analysis: {engine_analysis.get('error')}")
                 # Return a minimal analysis with default values
-                return self._create_default_game_analysis(game, metadata, start_time)
+                return self._create_default_game_analysis(game, self._extract_game_metadata(game), start_time)
             
             # Calculate statistics
             engine_correlation = engine_analysis.get('engine_correlation', 0.0)
             
-            # Calculate average CPL from positions
             positions = engine_analysis.get('positions', [])
-            cpl_values = []
-            previous_score = None
-            blunder_count = 0
-            
-            for pos in positions:
-                score_cp = pos.get('score_cp')
-                if score_cp is not None:
-                    if previous_score is not None:
-                        cpl = abs(score_cp - previous_score)
-                        cpl_values.append(cpl)
-                        # Count blunders (loss of >200 centipawns)
-                        if cpl > 200:
-                            blunder_count += 1
-                    previous_score = -score_cp  # Negate for opponent's perspective
             
-            avg_cpl = statistics.mean(cpl_values) if cpl_values else 999.0
+            # Nothing was analyzed (adjudicated or malformed game): skip the
+            # board walk and statistics and return defaults straight away
+            if not positions:
+                metadata = self._extract_game_metadata(game)
+                return GameAnalysis(
+                    headers=dict(game.headers),
+                    game_id=game_id_for(game),
+                    engine_correlation=0.0,
+                    avg_centipawn_loss=999.0,
+                    accuracy_score=0.0,
+                    suspicious_moves=[],
+                    time_controls=self._extract_time_controls(metadata),
+                    analysis_time=time.time() - start_time,
+                    metadata=metadata,
+                    result=_RESULT_CODES.get(metadata.get('result', '?'), RESULT_UNKNOWN)
+                )
             
-            # Calculate accuracy (simplified)
-            accuracy = 100 - min(avg_cpl / 2, 100) if avg_cpl < 200 else 50.0
-            accuracy = max(0.0, min(100.0, accuracy))
+            # Pack evaluations into one array per game; missing scores become NaN
+            scores = np.fromiter(
+                (np.nan if pos.get('score_cp') is None else pos['score_cp'] for pos in positions),
+                dtype=np.float64, count=len(positions)
+            )
             
             # ENHANCED: Analyze by game phases - safely reconstruct board state
-            opening_moves = []
-            middlegame_moves = []
-            endgame_moves = []
-            critical_moves = []
-            
-            # Reconstruct board and map positions to moves
+            # and record the piece count before each analyzed move
+            piece_counts = np.zeros(len(positions), dtype=np.int32)
             board_test = game.board()
             move_index = 0
+            popcount = chess.popcount
             
             for move in game.mainline_moves():
                 if move_index < len(positions):
-                    pos = positions[move_index]
-                    move_number = (move_index // 2) + 1
-                    
-                    # Phase detection based on move number and piece count
-                    piece_count = len(board_test.pieces(chess.PAWN, chess.WHITE)) + len(board_test.pieces(chess.PAWN, chess.BLACK))
-                    piece_count += len(board_test.pieces(chess.KNIGHT, chess.WHITE)) + len(board_test.pieces(chess.KNIGHT, chess.BLACK))
-                    piece_count += len(board_test.pieces(chess.BISHOP, chess.WHITE)) + len(board_test.pieces(chess.BISHOP, chess.BLACK))
-                    piece_count += len(board_test.pieces(chess.ROOK, chess.WHITE)) + len(board_test.pieces(chess.ROOK, chess.BLACK))
-                    
-                    if move_number <= 10:
-                        opening_moves.append(pos)
-                    elif piece_count <= 6:
-                        endgame_moves.append(pos)
-                    else:
-                        middlegame_moves.append(pos)
-                    
-                    # Detect critical positions (large score swings)
-                    score_cp = pos.get('score_cp', 0)
-                    if abs(score_cp) > 300:
-                        critical_moves.append(pos)
+                    # Pawns + minor/major pieces of both colours in one popcount
+                    piece_counts[move_index] = popcount(board_test.pawns | board_test.knights |
+                                                        board_test.bishops | board_test.rooks)
                 
                 board_test.push(move)
                 move_index += 1
             
+            # Get game metadata (the walk above already counted the main line)
+            metadata = self._extract_game_metadata(game, move_count=move_index)
+            
+            # CPL, blunders and per-phase evaluation means in one kernel pass
+            (avg_cpl, blunder_count, opening_cpl, middlegame_cpl, endgame_cpl,
+             critical_cpl, critical_count) = _game_kernel(scores, piece_counts[:move_index])
+            if math.isnan(avg_cpl):
+                avg_cpl = 999.0
+            
+            # Calculate accuracy (simplified)
+            accuracy = 100 - min(avg_cpl / 2, 100) if avg_cpl < 200 else 50.0
+            accuracy = max(0.0, min(100.0, accuracy))
+            
             # Calculate phase-specific accuracies
-            opening_accuracy = self._calculate_phase_accuracy(opening_moves)
-            middlegame_accuracy = self._calculate_phase_accuracy(middlegame_moves)
-            endgame_accuracy = self._calculate_phase_accuracy(endgame_moves)
-            critical_move_accuracy = self._calculate_phase_accuracy(critical_moves)
+            opening_accuracy = _phase_accuracy(opening_cpl)
+            middlegame_accuracy = _phase_accuracy(middlegame_cpl)
+            endgame_accuracy = _phase_accuracy(endgame_cpl)
+            critical_move_accuracy = _phase_accuracy(critical_cpl)
             
             # ENHANCED: Identify suspicious moves
             suspicious_moves = []
@@ -381,19 +744,15 @@ class ChessAnalyzer:
                 if pos.get('player_moved_best', False):
                     score_cp = pos.get('score_cp', 0)
                     if abs(score_cp) < 200:  # Complex position
-                        suspicious_moves.append({
-                            'move_number': pos.get('move_number', 0),
-                            'move': pos.get('move', ''),
-                            'best_move': pos.get('best_move', ''),
-                            'score_cp': score_cp
-                        })
+                        suspicious_moves.append(SuspiciousMove(
+                            pos.get('move_number', 0),
+                            pos.get('move', ''),
+                            pos.get('best_move', ''),
+                            score_cp
+                        ))
             
             # Time control info
-            time_controls = {
-                'time_class': metadata.get('time_class', 'unknown'),
-                'time_control': metadata.get('time_control', 'unknown'),
-                'rated': metadata.get('rated', False)
-            }
+            time_controls = self._extract_time_controls(metadata)
             
             # MODERN DETECTION: Calculate move time consistency (engine-like timing)
             move_times = engine_analysis.get('move_times', [])
@@ -402,14 +761,11 @@ class ChessAnalyzer:
             # MODERN DETECTION: Calculate probability correlation
             # This is the likelihood of finding the best moves consistently
             probability_correlation = self._calculate_probability_correlation(
-                engine_correlation, positions, critical_moves
+                engine_correlation, positions, critical_count
             )
             
-            # MODERN DETECTION: Extract game result and calculate win/draw/loss
-            result = metadata.get('result', '?')
-            win_rate = 1.0 if result == '1-0' else (0.5 if result == '1/2-1/2' else 0.0)
-            draw_rate = 1.0 if result == '1/2-1/2' else 0.0
-            loss_rate = 1.0 if result == '0-1' else 0.0
+            # MODERN DETECTION: Extract game result (win/draw/loss code)
+            result = _RESULT_CODES.get(metadata.get('result', '?'), RESULT_UNKNOWN)
             
             # MODERN DETECTION: Superhuman performance indicator
             # Check if performance matches IM+ level (2400+) at lower rating
@@ -424,7 +780,8 @@ class ChessAnalyzer:
             analysis_time = time.time() - start_time
             
             game_analysis = GameAnalysis(
-                game=game,
+                headers=dict(game.headers),
+                game_id=game_id_for(game),
                 engine_correlation=engine_correlation,
                 avg_centipawn_loss=avg_cpl,
                 accuracy_score=accuracy,
@@ -440,9 +797,7 @@ class ChessAnalyzer:
                 time_pressure_accuracy=time_pressure_accuracy,
                 move_time_consistency=move_time_consistency,
                 probability_correlation=probability_correlation,
-                win_loss_rate=win_rate,
-                draw_rate=draw_rate,
-                loss_rate=loss_rate,
+                result=result,
                 superhuman_score=superhuman_score
             )
             
@@ -458,7 +813,8 @@ class ChessAnalyzer:
         analysis_time = time.time() - start_time
         
         return GameAnalysis(
-            game=game,
+            headers=dict(game.headers),
+            game_id=game_id_for(game),
             engine_correlation=0.0,
             avg_centipawn_loss=999.0,
             accuracy_score=0.0,
@@ -476,33 +832,20 @@ class ChessAnalyzer:
             performance_vs_rating=0.0,
             move_time_consistency=0.0,
             probability_correlation=0.0,
-            win_loss_rate=0.0,
-            draw_rate=0.0,
-            loss_rate=0.0,
+            result=RESULT_UNKNOWN,
             superhuman_score=0.0,
             rating_differential_score=0.0
         )
     
-    def _calculate_phase_accuracy(self, positions: List[Dict]) -> float:
-        """Calculate accuracy for a specific game phase."""
-        if not positions:
-            return 0.0
-        
-        phase_cpl_values = []
-        for pos in positions:
-            score_cp = pos.get('score_cp')
-            if score_cp is not None:
-                phase_cpl_values.append(abs(score_cp))
-        
-        if not phase_cpl_values:
-            return 0.0
+    def _extract_game_metadata(self, game: chess.pgn.Game, move_count: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Extract metadata from game headers.
         
-        avg_phase_cpl = statistics.mean(phase_cpl_values)
-        accuracy = 100 - min(avg_phase_cpl / 2, 100) if avg_phase_cpl < 200 else 50.0
-        return max(0.0, min(100.0, accuracy))
-    
-    def _extract_game_metadata(self, game: chess.pgn.Game) -> Dict[str, Any]:
-        """Extract metadata from game headers."""
+        Args:
+            game: chess.pgn.Game object
+            move_count: Main line length, if the caller already knows it
+                (otherwise the main line is walked to count it)
+        """
         metadata = {}
         
         # Standard headers
@@ -518,101 +861,123 @@ class ChessAnalyzer:
                 metadata[header] = game.headers[header]
         
         # Calculate game length
-        board = game.board()
-        move_count = sum(1 for _ in game.mainline_moves())
+        if move_count is None:
+            move_count = sum(1 for _ in game.mainline_moves())
         metadata['move_count'] = move_count
         
         return metadata
     
+    def _extract_time_controls(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Time control info for a GameAnalysis from its metadata."""
+        return {
+            'time_class': metadata.get('time_class', 'unknown'),
+            'time_control': metadata.get('time_control', 'unknown'),
+            'rated': metadata.get('rated', False)
+        }
+    
     def _aggregate_analyses(self, game_analyses: List[GameAnalysis]) -> PlayerAnalysis:
         """Aggregate multiple game analyses into player analysis - ENHANCED DETECTIVE."""
         if not game_analyses:
             raise ValueError("No game analyses to aggregate")
         
         # Get username from first game
-        first_game = game_analyses[0].game
-        username = first_game.headers.get('White', '').split()[0] or 'Unknown'
-        
-        # Extract statistics
-        engine_correlations = [ga.engine_correlation for ga in game_analyses]
-        cpl_values = [ga.avg_centipawn_loss for ga in game_analyses]
-        accuracy_scores = [ga.accuracy_score for ga in game_analyses]
-        opening_accuracies = [ga.opening_accuracy for ga in game_analyses]
-        endgame_accuracies = [ga.endgame_accuracy for ga in game_analyses]
-        critical_accuracies = [ga.critical_move_accuracy for ga in game_analyses]
-        blunder_counts = [ga.blunder_count for ga in game_analyses]
+        username = game_analyses[0].headers.get('White', '').split()[0] or 'Unknown'
+        
+        # Extract statistics in a single pass: running sums for the averages
+        # and Welford's online variance for the accuracy spread
+        n = len(game_analyses)
+        sum_ec = sum_cpl = 0.0
+        sum_open = sum_mid = sum_end = sum_crit = 0.0
+        sum_prob = sum_superhuman = sum_time_pressure = 0.0
+        total_blunders = 0
+        result_counts = [0, 0, 0]  # Indexed by RESULT_LOSS/DRAW/WIN
+        suspicious_game_count = 0
+        extremely_accurate_games = 0  # Games with >97% engine correlation
+        acc_mean = acc_m2 = 0.0
+        
+        for k, ga in enumerate(game_analyses, 1):
+            engine_correlation = ga.engine_correlation
+            sum_ec += engine_correlation
+            if engine_correlation > 97.0:
+                extremely_accurate_games += 1
+            sum_cpl += ga.avg_centipawn_loss
+            sum_open += ga.opening_accuracy
+            sum_mid += ga.middlegame_accuracy
+            sum_end += ga.endgame_accuracy
+            sum_crit += ga.critical_move_accuracy
+            sum_prob += ga.probability_correlation
+            sum_superhuman += ga.superhuman_score
+            sum_time_pressure += ga.time_pressure_accuracy
+            total_blunders += ga.blunder_count
+            
+            if ga.result != RESULT_UNKNOWN:
+                result_counts[ga.result] += 1
+            
+            if ga.is_suspicious:
+                suspicious_game_count += 1
+            
+            delta = ga.accuracy_score - acc_mean
+            acc_mean += delta / k
+            acc_m2 += delta * (ga.accuracy_score - acc_mean)
         
         # Calculate averages
-        avg_engine_correlation = statistics.mean(engine_correlations) if engine_correlations else 0
-        avg_centipawn_loss = statistics.mean(cpl_values) if cpl_values else 999
-        accuracy_consistency = statistics.stdev(accuracy_scores) if len(accuracy_scores) > 1 else 0
-        
-        # Count suspicious games
-        suspicious_game_count = sum(1 for ga in game_analyses if ga.is_suspicious)
-        extremely_accurate_games = sum(1 for ec in engine_correlations if ec > 97.0)
+        avg_engine_correlation = sum_ec / n
+        avg_centipawn_loss = sum_cpl / n
+        accuracy_consistency = math.sqrt(acc_m2 / (n - 1)) if n > 1 else 0
         
         # Analyze by time control
         performance_by_tc = self._analyze_performance_by_time_control(game_analyses)
         
         # ENHANCED: Calculate detective metrics
-        avg_opening_accuracy = statistics.mean(opening_accuracies) if opening_accuracies else 0
-        avg_endgame_accuracy = statistics.mean(endgame_accuracies) if endgame_accuracies else 0
-        avg_critical_accuracy = statistics.mean(critical_accuracies) if critical_accuracies else 0
-        total_blunders = sum(blunder_counts)
-        expected_blunders = len(game_analyses) * 2  # Rough estimate
+        avg_opening_accuracy = sum_open / n
+        avg_endgame_accuracy = sum_end / n
+        avg_critical_accuracy = sum_crit / n
+        expected_blunders = n * 2  # Rough estimate
         blunder_avoidance = max(0, 100 - (total_blunders / max(expected_blunders, 1) * 100))
         
         # Opening preparation score (perfect openings are suspicious)
         opening_prep_score = self._analyze_opening_preparation(game_analyses)
         
         # Endgame mastery (if much better than middlegame, suspicious)
-        endgame_vs_middle = avg_endgame_accuracy - statistics.mean([ga.middlegame_accuracy for ga in game_analyses]) if game_analyses else 0
+        endgame_vs_middle = avg_endgame_accuracy - sum_mid / n
         endgame_mastery = max(0, min(endgame_vs_middle * 10, 100))  # Scale the difference
         
-        # NEW: Rating progression analysis
-        rating_jumps = self._analyze_rating_progression(game_analyses)
+        # NEW: Rating progression analysis (results decoded once for both passes)
+        result_codes = _decode_results(game_analyses)
+        rating_jumps = self._analyze_rating_progression(game_analyses, result_codes)
         rating_jump_suspicion = min(100, len(rating_jumps) * 20) if rating_jumps else 0.0
         
         # NEW: Win rate analysis
-        win_rate_analysis = self._calculate_win_rate_analysis(game_analyses)
+        win_rate_analysis = self._calculate_win_rate_analysis(game_analyses, result_codes)
         win_rate_anomaly = win_rate_analysis.get('anomaly_score', 0.0)
         
         # MODERN DETECTION: Calculate move time consistency
-        move_times_all = []
-        for ga in game_analyses:
-            if 'move_times' in ga.metadata:
-                move_times_all.extend(ga.metadata.get('move_times', []))
+        move_times_all = list(chain.from_iterable(
+            ga.metadata.get('move_times', ()) for ga in game_analyses
+        ))
         avg_move_time_consistency = self._calculate_move_time_consistency(move_times_all) if move_times_all else 0.0
         
         # MODERN DETECTION: Average probability correlation
-        prob_correlations = [ga.probability_correlation for ga in game_analyses]
-        avg_probability_correlation = statistics.mean(prob_correlations) if prob_correlations else 0.0
+        avg_probability_correlation = sum_prob / n
         
         # MODERN DETECTION: Win/Draw/Loss rates
-        wins = sum(1 for ga in game_analyses if ga.win_loss_rate == 1.0)
-        draws = sum(1 for ga in game_analyses if ga.draw_rate == 1.0)
-        losses = sum(1 for ga in game_analyses if ga.loss_rate == 1.0)
-        total = len(game_analyses)
-        
-        avg_win_rate = (wins / total * 100) if total > 0 else 0.0
-        avg_draw_rate = (draws / total * 100) if total > 0 else 0.0
-        avg_loss_rate = (losses / total * 100) if total > 0 else 0.0
+        avg_win_rate = result_counts[RESULT_WIN] / n * 100
+        avg_draw_rate = result_counts[RESULT_DRAW] / n * 100
+        avg_loss_rate = result_counts[RESULT_LOSS] / n * 100
         
         # MODERN DETECTION: Average superhuman score
-        superhuman_scores = [ga.superhuman_score for ga in game_analyses]
-        avg_superhuman_score = statistics.mean(superhuman_scores) if superhuman_scores else 0.0
+        avg_superhuman_score = sum_superhuman / n
         
         # MODERN DETECTION: Time scramble accuracy
-        time_scramble_accuracies = [ga.time_pressure_accuracy for ga in game_analyses]
-        avg_time_scramble_accuracy = statistics.mean(time_scramble_accuracies) if time_scramble_accuracies else 0.0
+        avg_time_scramble_accuracy = sum_time_pressure / n
         
         # Move time suspicion (placeholder, uses tqdm pattern)
         move_time_suspicion = 0.0  # Enhanced in reporter if available
         
         player_analysis = PlayerAnalysis(
             username=username,
-            games_analyzed=len(game_analyses),
-            total_games_fetched=len(game_analyses),  # Will be updated by caller
+            games_analyzed=n,
+            total_games_fetched=n,  # Will be updated by caller
             game_analyses=game_analyses,
             avg_engine_correlation=avg_engine_correlation,
             avg_centipawn_loss=avg_centipawn_loss,
@@ -643,33 +1008,28 @@ class ChessAnalyzer:
     
     def _analyze_performance_by_time_control(self, game_analyses: List[GameAnalysis]) -> Dict:
         """Analyze performance differences across time controls."""
+        # Running [games, engine correlation sum, CPL sum] per time class
         tc_groups = {}
         
         for ga in game_analyses:
             tc = ga.time_controls.get('time_class', 'unknown')
+            group = tc_groups.get(tc)
+            if group is None:
+                group = tc_groups[tc] = [0, 0.0, 0.0]
             
-            if tc not in tc_groups:
-                tc_groups[tc] = {
-                    'games': 0,
-                    'engine_correlations': [],
-                    'cpl_values': [],
-                }
-            
-            tc_groups[tc]['games'] += 1
-            tc_groups[tc]['engine_correlations'].append(ga.engine_correlation)
-            tc_groups[tc]['cpl_values'].append(ga.avg_centipawn_loss)
+            group[0] += 1
+            group[1] += ga.engine_correlation
+            group[2] += ga.avg_centipawn_loss
         
         # Calculate statistics for each time control
-        results = {}
-        for tc, data in tc_groups.items():
-            if data['games'] > 0:
-                results[tc] = {
-                    'game_count': data['games'],
-                    'avg_engine_correlation': statistics.mean(data['engine_correlations']) if data['engine_correlations'] else 0,
-                    'avg_cpl': statistics.mean(data['cpl_values']) if data['cpl_values'] else 999,
-                }
-        
-        return results
+        return {
+            tc: {
+                'game_count': games,
+                'avg_engine_correlation': ec_sum / games,
+                'avg_cpl': cpl_sum / games,
+            }
+            for tc, (games, ec_sum, cpl_sum) in tc_groups.items()
+        }
     
     def generate_detailed_report(self, player_analysis: PlayerAnalysis) -> Dict[str, Any]:
         """Generate detailed report dictionary."""
@@ -695,11 +1055,13 @@ class ChessAnalyzer:
         }
         
         # Add individual game details (limit to 20 games)
-        for i, ga in enumerate(player_analysis.game_analyses[:20]):
-            report['game_details'].append({
-                'game_number': i + 1,
-                'players': f"{ga.metadata.get('white', '?')} vs {ga.metadata.get('black', '?')}",
-                'result': ga.metadata.get('result', '?'),
+        add_detail = report['game_details'].append
+        for i, ga in enumerate(player_analysis.game_analyses[:20], 1):
+            metadata = ga.metadata
+            add_detail({
+                'game_number': i,
+                'players': f"{metadata.get('white', '?')} vs {metadata.get('black', '?')}",
+                'result': metadata.get('result', '?'),
                 'engine_correlation': ga.engine_correlation,
                 'avg_cpl': ga.avg_centipawn_loss,
                 'accuracy': ga.accuracy_score,
@@ -713,34 +1075,30 @@ class ChessAnalyzer:
     def _detect_suspicious_patterns(self, player_analysis: PlayerAnalysis) -> List[Dict]:
         """Detect suspicious patterns across games."""
         patterns = []
+        games_analyzed = player_analysis.games_analyzed
+        correlations = [ga.engine_correlation for ga in player_analysis.game_analyses]
         
-        if player_analysis.games_analyzed >= 10:
+        if games_analyzed >= 10:
             # Pattern 1: Sudden improvement
-            games = player_analysis.game_analyses
-            if len(games) >= 10:
-                first_half = games[:5]
-                last_half = games[-5:]
+            if len(correlations) >= 10:
+                first_avg = _fmean(correlations[:5])
+                last_avg = _fmean(correlations[-5:])
                 
-                if first_half and last_half:
-                    first_avg = statistics.mean([ga.engine_correlation for ga in first_half])
-                    last_avg = statistics.mean([ga.engine_correlation for ga in last_half])
-                    
-                    if last_avg - first_avg > 20:
-                        patterns.append({
-                            'pattern': 'sudden_improvement',
-                            'description': f'Engine correlation improved from {first_avg:.1f}% to {last_avg:.1f}%',
-                            'severity': 'high'
-                        })
+                if last_avg - first_avg > 20:
+                    patterns.append({
+                        'pattern': 'sudden_improvement',
+                        'description': f'Engine correlation improved from {first_avg:.1f}% to {last_avg:.1f}%',
+                        'severity': 'high'
+                    })
         
         # Pattern 2: Too many perfect games
         perfect_threshold = self.thresholds.get('engine_correlation_red_flag', 95)
-        perfect_games = sum(1 for ga in player_analysis.game_analyses 
-                          if ga.engine_correlation > perfect_threshold)
+        perfect_games = sum(1 for ec in correlations if ec > perfect_threshold)
         
-        if perfect_games > player_analysis.games_analyzed * 0.3:
+        if perfect_games > games_analyzed * 0.3:
             patterns.append({
                 'pattern': 'excessive_perfect_games',
-                'description': f'{perfect_games}/{player_analysis.games_analyzed} games >{perfect_threshold}% engine correlation',
+                'description': f'{perfect_games}/{games_analyzed} games >{perfect_threshold}% engine correlation',
                 'severity': 'high'
             })
         
@@ -749,33 +1107,33 @@ class ChessAnalyzer:
     def _generate_recommendations(self, player_analysis: PlayerAnalysis) -> List[str]:
         """Generate recommendations based on analysis."""
         recommendations = []
-        score = player_analysis.suspicion_score
+        pa = player_analysis
         
-        if player_analysis.games_analyzed == 0:
+        # Checked before suspicion_score so empty analyses never compute it
+        if pa.games_analyzed == 0:
             recommendations.append("⚠️ No games could be analyzed.")
             return recommendations
         
-        if score >= 70:
-            recommendations.append("⚠️ HIGH RISK: Player shows multiple strong indicators of potential assistance.")
-            recommendations.append("Recommend detailed manual review of games with >95% engine correlation.")
-        elif score >= 40:
-            recommendations.append("⚠️ MODERATE RISK: Some suspicious patterns detected.")
-            recommendations.append("Review games with highest engine correlation individually.")
-        else:
-            recommendations.append("✅ LOW RISK: No strong indicators detected.")
+        recommendations.extend(_RISK_BAND_MESSAGES[
+            bisect_right(_RISK_BAND_THRESHOLDS, pa.suspicion_score)
+        ])
         
         # Specific recommendations
-        if player_analysis.avg_centipawn_loss < 15:
-            recommendations.append(f"Note: Very low average CPL ({player_analysis.avg_centipawn_loss:.1f})")
+        cpl = pa.avg_centipawn_loss
+        if cpl < 15:
+            recommendations.append(f"Note: Very low average CPL ({cpl:.1f})")
         
-        if player_analysis.extremely_accurate_games > 0:
-            recommendations.append(f"Found {player_analysis.extremely_accurate_games} games with >97% engine correlation.")
+        extremely_accurate = pa.extremely_accurate_games
+        if extremely_accurate > 0:
+            recommendations.append(f"Found {extremely_accurate} games with >97% engine correlation.")
         
-        if player_analysis.critical_position_handling > 95:
-            recommendations.append(f"Critical position handling: {player_analysis.critical_position_handling:.1f}% (suspiciously high)")
+        critical_handling = pa.critical_position_handling
+        if critical_handling > 95:
+            recommendations.append(f"Critical position handling: {critical_handling:.1f}% (suspiciously high)")
         
-        if player_analysis.opening_preparation_score > 90:
-            recommendations.append(f"Opening preparation appears unusually strong: {player_analysis.opening_preparation_score:.1f}%")
+        opening_prep = pa.opening_preparation_score
+        if opening_prep > 90:
+            recommendations.append(f"Opening preparation appears unusually strong: {opening_prep:.1f}%")
         
         return recommendations
     
@@ -784,57 +1142,56 @@ class ChessAnalyzer:
         if not game_analyses:
             return 0.0
         
-        opening_scores = []
+        # Sum the per-game scores in the same pass that buckets them;
+        # games below 85% score 0 and add nothing
+        total = 0.0
         for ga in game_analyses:
+            opening_accuracy = ga.opening_accuracy
             # If opening accuracy is near perfect (>95%), it's suspicious
-            if ga.opening_accuracy > 95:
-                opening_scores.append(100)
-            elif ga.opening_accuracy > 85:
-                opening_scores.append(ga.opening_accuracy)
-            else:
-                opening_scores.append(0)
-        
-        if opening_scores:
-            avg_prep = statistics.mean(opening_scores)
-            # Scale to 0-100
-            return min(100, avg_prep)
-        return 0.0
+            if opening_accuracy > 95:
+                total += 100
+            elif opening_accuracy > 85:
+                total += opening_accuracy
+        
+        avg_prep = total / len(game_analyses)
+        # Scale to 0-100
+        return min(100, avg_prep)
     
-    def _analyze_rating_progression(self, game_analyses: List[GameAnalysis]) -> List[float]:
-        """Detect suspicious rating jumps from game wins/losses."""
+    def _analyze_rating_progression(self, game_analyses: List[GameAnalysis],
+                                    result_codes: Optional[np.ndarray] = None) -> List[float]:
+        """
+        Detect suspicious rating jumps from game wins/losses.
+        
+        Args:
+            game_analyses: Analyzed games, oldest first
+            result_codes: Optional _decode_results output for game_analyses
+        """
         if len(game_analyses) < 2:
             return []
+        if result_codes is None:
+            result_codes = _decode_results(game_analyses)
+        
+        # The estimate (starting at 1600) moves +K on a win, -K on a loss
+        # and 0 otherwise, so the jump into game i is K for a decisive game
+        # and 0 for anything else. No estimate needs to be built: with K at
+        # or below the threshold nothing can be flagged.
+        if ELO_K_FACTOR <= RATING_JUMP_THRESHOLD:
+            return []
         
-        rating_jumps = []
-        estimated_rating = 1600  # Starting point
-        
-        for ga in game_analyses:
-            # Extract result
-            result = ga.metadata.get('result', '?')
-            
-            if result == '1-0':
-                # Win: +/-32 Elo points (standard)
-                estimated_rating += 32
-            elif result == '0-1':
-                # Loss: -32 Elo points
-                estimated_rating -= 32
-            elif result == '1/2-1/2':
-                # Draw: 0
-                pass
-            
-            rating_jumps.append(estimated_rating)
-        
-        # Detect anomalies (sudden jumps)
-        anomalies = []
-        for i in range(1, len(rating_jumps)):
-            jump = abs(rating_jumps[i] - rating_jumps[i-1])
-            if jump > 50:  # Large jump
-                anomalies.append(jump)
-        
-        return anomalies
+        # Detect anomalies (sudden jumps); the first game has no predecessor
+        later_results = result_codes[1:]
+        decisive = np.count_nonzero((later_results == RESULT_WIN) | (later_results == RESULT_LOSS))
+        return [ELO_K_FACTOR] * int(decisive)
     
-    def _calculate_win_rate_analysis(self, game_analyses: List[GameAnalysis]) -> Dict[str, float]:
-        """Calculate win rate and compare to expected based on ratings."""
+    def _calculate_win_rate_analysis(self, game_analyses: List[GameAnalysis],
+                                     result_codes: Optional[np.ndarray] = None) -> Dict[str, float]:
+        """
+        Calculate win rate and compare to expected based on ratings.
+        
+        Args:
+            game_analyses: Analyzed games
+            result_codes: Optional _decode_results output for game_analyses
+        """
         if not game_analyses:
             return {
                 'win_rate': 0.0,
@@ -842,29 +1199,18 @@ class ChessAnalyzer:
                 'anomaly_score': 0.0
             }
         
-        wins = 0
-        losses = 0
-        draws = 0
-        opponent_ratings = []
-        player_ratings = []
+        if result_codes is None:
+            result_codes = _decode_results(game_analyses)
+        wins = int(np.count_nonzero(result_codes == RESULT_WIN))
+        losses = int(np.count_nonzero(result_codes == RESULT_LOSS))
+        draws = int(np.count_nonzero(result_codes == RESULT_DRAW))
+        opponent_rating_sum = 0
+        player_rating_sum = 0
         
         for ga in game_analyses:
-            result = ga.metadata.get('result', '?')
-            
-            # Get ratings from game headers
-            white_rating = int(ga.game.headers.get('WhiteElo', 1600))
-            black_rating = int(ga.game.headers.get('BlackElo', 1600))
-            
             # Assume player is white for simplicity (could be either)
-            player_ratings.append(white_rating)
-            opponent_ratings.append(black_rating)
-            
-            if result == '1-0':
-                wins += 1
-            elif result == '0-1':
-                losses += 1
-            elif result == '1/2-1/2':
-                draws += 1
+            player_rating_sum += ga.white_elo
+            opponent_rating_sum += ga.black_elo
         
         total_games = wins + losses + draws
         if total_games == 0:
@@ -878,12 +1224,12 @@ class ChessAnalyzer:
         actual_win_rate = (wins + draws * 0.5) / total_games * 100
         
         # Calculate expected win rate (based on Elo)
-        avg_opponent_rating = statistics.mean(opponent_ratings) if opponent_ratings else 1600
-        avg_player_rating = statistics.mean(player_ratings) if player_ratings else 1600
+        # Every game contributes a rating, so game_analyses is never empty here
+        avg_opponent_rating = opponent_rating_sum / len(game_analyses)
+        avg_player_rating = player_rating_sum / len(game_analyses)
         rating_diff = avg_player_rating - avg_opponent_rating
         
-        # Elo formula: expected_score = 1 / (1 + 10^(-rating_diff/400))
-        expected_win_rate = 1 / (1 + 10 ** (-rating_diff / 400)) * 100
+        expected_win_rate = _elo_logistic(rating_diff) * 100
         
         # Calculate anomaly (how much better than expected)
         anomaly_score = max(0, actual_win_rate - expected_win_rate)
@@ -896,26 +1242,32 @@ class ChessAnalyzer:
             'avg_player_rating': avg_player_rating
         }
     
-    def _calculate_move_time_consistency(self, move_times: List[float]) -> float:
+    def _calculate_move_time_consistency(self, move_times) -> float:
         """
         MODERN DETECTION: Calculate how consistent move times are.
         High consistency (70-90% of moves taking similar time) is suspicious.
         Engines think consistently, humans vary.
         
+        Args:
+            move_times: Move times in seconds (list or ndarray)
+        
         Returns: Score 0-100, higher = more engine-like
         """
-        if len(move_times) < 5:
+        count = len(move_times)
+        if count < 5:
             return 0.0
         
-        # Group move times by 0.2 second buckets
-        time_groups = {}
-        for t in move_times:
-            bucket = round(t / 0.2) * 0.2
-            time_groups[bucket] = time_groups.get(bucket, 0) + 1
-        
-        # Find most common time bucket
-        max_group = max(time_groups.values()) if time_groups else 0
-        consistency = (max_group / len(move_times)) * 100
+        # Group move times by 0.2 second buckets and find the most common one.
+        # Short lists are cheaper to count in Python than to convert to an
+        # array; np.rint rounds half to even exactly like round().
+        # Bucket keys are ints; they stay t / 0.2 rather than t * 5, which
+        # puts times such as 0.3s (1.4999... vs 1.5) in a different bucket.
+        if count < MOVE_TIME_BINCOUNT_MIN and not isinstance(move_times, np.ndarray):
+            max_group = max(Counter([round(t / 0.2) for t in move_times]).values())
+        else:
+            buckets = np.rint(np.asarray(move_times, dtype=np.float64) / 0.2).astype(np.int64)
+            max_group = int(np.bincount(buckets - buckets.min()).max())
+        consistency = (max_group / count) * 100
         
         # High consistency is suspicious (>70%)
         # But not impossibly so (allow up to 90%)
@@ -925,7 +1277,7 @@ class ChessAnalyzer:
     
     def _calculate_probability_correlation(
         self, engine_correlation: float, positions: List[Dict], 
-        critical_moves: List[Dict]
+        critical_count: int
     ) -> float:
         """
         MODERN DETECTION: Calculate probability correlation.
@@ -935,7 +1287,8 @@ class ChessAnalyzer:
         
         Returns: Score 0-100, higher = more likely to be engine-assisted
         """
-        if not positions:
+        position_count = len(positions)
+        if not position_count:
             return 0.0
         
         # Base probability of finding best move
@@ -943,7 +1296,7 @@ class ChessAnalyzer:
         base_probability = engine_correlation / 100.0
         
         # If player found too many best moves in critical positions
-        critical_accuracy = (len(critical_moves) / max(len(positions), 1)) * 100 if critical_moves else 0
+        critical_accuracy = (critical_count / position_count) * 100 if critical_count else 0
         
         # Probability calculation: 
         # Very high accuracy at critical positions is exponentially suspicious
@@ -952,13 +1305,15 @@ class ChessAnalyzer:
         if engine_correlation > 90:
             # At 90%+ correlation, probability of achieving by chance
             # becomes astronomically low
-            prob_score = min(100, (engine_correlation - 90) * 5)  # Extra weighting
+            prob_score = (engine_correlation - 90) * 5  # Extra weighting
+            if prob_score > 100:
+                prob_score = 100
         
-        if critical_accuracy > 95 and len(critical_moves) > 3:
+        if critical_accuracy > 95 and critical_count > 3:
             # Finding best moves in complex positions consistently
             prob_score += 20
         
-        return min(100, prob_score)
+        return 100 if prob_score > 100 else prob_score
     
     def _calculate_superhuman_indicator(
         self, opening_acc: float, middlegame_acc: float, 
@@ -975,34 +1330,66 @@ class ChessAnalyzer:
         
         Returns: Score 0-100, higher = more superhuman
         """
-        score = 0.0
-        
-        # IM level play is 95%+ accuracy consistently
-        if middlegame_acc > 95:
-            score += 30
-        elif middlegame_acc > 90:
-            score += 15
-        
-        if critical_acc > 95:
-            score += 25
-        elif critical_acc > 90:
-            score += 12
-        
-        if endgame_acc > 95:
-            score += 20
-        elif endgame_acc > 90:
-            score += 10
-        
-        if opening_acc > 95:
-            score += 15
-        
-        # High engine correlation is another indicator
-        if engine_corr > 92:
-            score += 15
+        # Stacked thresholds as bool arithmetic instead of an if/elif ladder:
+        # >90 and >95 add up to the higher tier's weight
+        score = float(
+            # IM level play is 95%+ accuracy consistently
+            15 * (middlegame_acc > 90) + 15 * (middlegame_acc > 95)
+            + 12 * (critical_acc > 90) + 13 * (critical_acc > 95)
+            + 10 * (endgame_acc > 90) + 10 * (endgame_acc > 95)
+            + 15 * (opening_acc > 95)
+            # High engine correlation is another indicator
+            + 15 * (engine_corr > 92)
+        )
         
-        return min(100, score)
+        return 100 if score > 100 else score
     
     def cleanup(self) -> None:
         """Clean up resources."""
         self.engine_manager.cleanup()
-        logger.info("Analyzer cleaned up")
\ No newline at end of file
+        logger.info("Analyzer cleaned up")
+
+@lru_cache(maxsize=1)
+def _worker_analyzer(config_key: str) -> ChessAnalyzer:
+    """Process-local analyzer, built once per worker for a given config."""
+    analyzer = ChessAnalyzer(json.loads(config_key))
+    # Workers do all the engine work in parallel mode, so each one saves
+    # (merges) its evaluation cache when it exits; the parent saves its own
+    # in cleanup() once the pool has shut down
+    multiprocessing.util.Finalize(analyzer, analyzer.cleanup, exitpriority=0)
+    return analyzer
+
+
+def _analyze_one(pgn_text: str, config_key: str) -> GameAnalysis:
+    """
+    Process-pool worker for ChessAnalyzer.analyze_games.
+
+    Args:
+        pgn_text: Game as PGN text
+        config_key: Analyzer configuration serialized as sorted JSON
+
+    Returns:
+        GameAnalysis of the game
+    """
+    game = chess.pgn.read_game(io.StringIO(pgn_text))
+    return _worker_analyzer(config_key)._analyze_single_game(game)
+
+
+def _parse_games(games: List[Any]) -> List[chess.pgn.Game]:
+    """Parse any PGN strings in games, leaving chess.pgn.Game objects as they are."""
+    return [chess.pgn.read_game(io.StringIO(game)) if isinstance(game, str) else game
+            for game in games]
+
+
+def _analyze_player(pgn_texts: List[str], config_key: str) -> PlayerAnalysis:
+    """
+    Process-pool worker for ChessAnalyzer.analyze_players.
+
+    Args:
+        pgn_texts: The player's games as PGN text
+        config_key: Analyzer configuration serialized as sorted JSON
+
+    Returns:
+        PlayerAnalysis of the player's games
+    """
+    return _worker_analyzer(config_key).analyze_games(_parse_games(pgn_texts))
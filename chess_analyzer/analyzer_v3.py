@@ -4,20 +4,36 @@ Ultra-fast, accurate, detailed forensic analysis with cloud integration
 Combines Lichess API, local analysis, pattern detection, and statistical scoring
 """
 
+import bisect
+import io
 import json
+import re
+import sys
 import time
+from array import array
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from collections import defaultdict, Counter
+import multiprocessing.util
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from operator import itemgetter
+from collections import defaultdict, Counter, OrderedDict
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass, asdict, field
-import statistics
+from dataclasses import dataclass, field
 import chess
+import chess.engine
 import chess.pgn
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 import hashlib
+import heapq
+import sqlite3
+import numpy as np
+
+from .utils.helpers import NUMBA_AVAILABLE, njit
 
 
 @dataclass
@@ -98,7 +114,39 @@ class GameAnalysisV3:
     is_suspicious: bool = False
     suspicion_score: float = 0.0
     reason: str = ""
+    
+    def asdict(self) -> Dict:
+        """
+        Same result as dataclasses.asdict, without its generic recursion
+        and deep copies (the nested patterns hold only scalars)
+        """
+        data = self.__dict__.copy()
+        data['time_pattern'] = self.time_pattern.__dict__.copy()
+        data['engine_pattern'] = self.engine_pattern.__dict__.copy()
+        data['blunder_analysis'] = self.blunder_analysis.__dict__.copy()
+        data['accuracy'] = self.accuracy.__dict__.copy()
+        return data
+
+
+# Scalar fields of GameAnalysisV3 with their defaults, in constructor order
+# around the four nested patterns (which come after player_color)
+ANALYSIS_SCALAR_DEFAULTS = {
+    'game_id': '',
+    'white': '',
+    'black': '',
+    'result': '',
+    'player_color': '',
+    'opponent_elo': 0,
+    'time_control': '',
+    'move_count': 0,
+    'is_suspicious': False,
+    'suspicion_score': 0.0,
+    'reason': '',
+}
+_analysis_scalars = itemgetter(*ANALYSIS_SCALAR_DEFAULTS)
 
+# Shared default for absent nested patterns; only ever unpacked, never mutated
+_EMPTY_DICT: Dict = {}
 
 # Piece values for material-based evaluation (in centipawns)
 PIECE_VALUES = {
@@ -110,6 +158,174 @@ PIECE_VALUES = {
     'K': 0      # King (no value, but included for completeness)
 }
 
+# PIECE_VALUES indexed by piece type (chess.PAWN == 1 ... chess.KING == 6)
+PIECE_TYPE_VALUES = array('h', [0] + [PIECE_VALUES[chess.piece_symbol(piece_type).upper()]
+                                      for piece_type in chess.PIECE_TYPES])
+
+# Lichess accepts up to 300 game IDs per export request
+LICHESS_EXPORT_BATCH = 300
+
+# Pooled keep-alive connections per host for Lichess requests
+HTTP_POOL_SIZE = 16
+
+# Minimum seconds between progress bar redraws (at most 20 per second)
+PROGRESS_INTERVAL = 0.05
+
+# Engine evaluations remembered per analyzer, keyed by position
+POSITION_CACHE_SIZE = 100_000
+
+# One complete "h:mm:ss" entry of a comma-separated ClockTimes header;
+# malformed entries are skipped
+_CLOCK_TIME = re.compile(r'(?:^|,)\s*(\d+):(\d+):(\d+)\s*(?=,|$)')
+_CLOCK_SECONDS = np.array([3600, 60, 1], dtype=np.int64)
+
+
+def _lichess_game_id(headers) -> Optional[str]:
+    """Return the Lichess game ID from a game's Link header, if it has one"""
+    link = headers.get("Link", "")
+    if "lichess.org" not in link:
+        return None
+    
+    game_id = link.split('/')[-1].split('?')[0]
+    if not game_id or len(game_id) < 8:
+        return None
+    return game_id
+
+
+def _parse_lichess_analysis(analysis: List[Dict]) -> List[Dict]:
+    """Convert a Lichess 'analysis' array to evaluation dicts"""
+    evals = []
+    for move_analysis in analysis:
+        eval_info = {}
+        
+        # Get centipawn evaluation
+        if 'eval' in move_analysis:
+            eval_info['centipawns'] = move_analysis['eval']
+        elif 'mate' in move_analysis:
+            eval_info['mate'] = move_analysis['mate']
+            eval_info['centipawns'] = None
+        else:
+            continue
+        
+        evals.append(eval_info)
+    return evals
+
+
+# Move quality buckets: a move whose evaluation change (before - after) is
+# at least MOVE_SCORE_BOUNDS[k - 1] and below MOVE_SCORE_BOUNDS[k] scores
+# MOVE_SCORE_VALUES[k]
+MOVE_SCORE_BOUNDS = np.array([-100.0, -50.0, -25.0, 0.0, 25.0, 50.0, 100.0])
+MOVE_SCORE_VALUES = np.array([
+    5.0,    # Major blunder (>1 pawn loss)
+    20.0,   # Blunder (1+ pawn loss)
+    40.0,   # Mistake (0.5 pawn loss)
+    55.0,   # Inaccuracy (0.25 pawn loss)
+    70.0,   # Okay move (no material loss)
+    80.0,   # Good move (0.25+ pawn improvement)
+    90.0,   # Very good move (0.5+ pawn improvement)
+    100.0,  # Excellent move (>1 pawn improvement)
+])
+
+
+def _centipawn_array(evaluations) -> np.ndarray:
+    """
+    Centipawn evaluations as a float64 array, NaN where a position has no
+    centipawn score (mate). An array is returned unchanged, so analysis
+    helpers accept either form.
+    """
+    if isinstance(evaluations, np.ndarray):
+        return evaluations
+    return np.array([e.get("centipawns") for e in evaluations], dtype=np.float64)
+
+
+def _move_scores_lut(cp):
+    """
+    Quality score (0-100) for each move from consecutive evaluations.
+    
+    Args:
+        cp: float64 centipawn evaluations (NaN = mate / no evaluation)
+    
+    Returns:
+        float64 array of len(cp) - 1 scores; 50.0 when either side is NaN
+    """
+    # Positive change means player improved position (or opponent worsened it)
+    change = cp[:-1] - cp[1:]
+    # Bucket lookup replaces the >= ladder: side='right' puts a change equal
+    # to a bound in the bucket above it
+    scores = MOVE_SCORE_VALUES[np.searchsorted(MOVE_SCORE_BOUNDS, change, side='right')]
+    scores[np.isnan(change)] = 50.0  # Neutral score for mate positions
+    return scores
+
+
+# nogil lets the analysis threads score moves concurrently; fastmath is
+# left off because NaN marks mate positions
+_move_scores_kernel = (njit(cache=True, nogil=True)(_move_scores_lut)
+                       if NUMBA_AVAILABLE else _move_scores_lut)
+
+
+def _suspicion_loop(top1, consistent, time_cv, blunder_rate, critical_blunders,
+                    accuracy_std, opponent_elo, accuracy):
+    """
+    Multi-layer suspicion score (0-100) for each game.
+    
+    Args:
+        One float64 array per per-game metric, all of equal length;
+        consistent is 1.0 where the time pattern is suspiciously consistent
+    
+    Returns:
+        float64 array of suspicion scores
+    """
+    scores = np.zeros(top1.shape[0])
+    for i in range(top1.shape[0]):
+        score = 0.0
+        
+        # Factor 1: Engine matching (max 40 points)
+        if top1[i] > 92:
+            score += 30.0
+        elif top1[i] > 85:
+            score += 15.0
+        
+        # Factor 2: Time consistency (max 25 points)
+        if consistent[i]:
+            score += 15.0
+        if time_cv[i] < 0.2:
+            score += 10.0
+        
+        # Factor 3: Blunder rate (max 20 points)
+        if blunder_rate[i] < 2:  # Very low blunder rate
+            score += 10.0
+        if critical_blunders[i] == 0:
+            score += 10.0
+        
+        # Factor 4: Accuracy variance (max 15 points)
+        if accuracy_std[i] < 5:
+            score += 10.0
+        
+        # Rating context (max 20 points): extremely high accuracy vs strong opposition
+        if opponent_elo[i] > 2400 and accuracy[i] > 88:
+            score += 10.0
+        
+        scores[i] = score
+    return scores
+
+
+def _suspicion_masks(top1, consistent, time_cv, blunder_rate, critical_blunders,
+                     accuracy_std, opponent_elo, accuracy):
+    """NumPy equivalent of _suspicion_loop for when Numba is not installed."""
+    return (
+        np.where(top1 > 92, 30.0, np.where(top1 > 85, 15.0, 0.0))
+        + 15.0 * (consistent != 0)
+        + 10.0 * (time_cv < 0.2)
+        + 10.0 * (blunder_rate < 2)
+        + 10.0 * (critical_blunders == 0)
+        + 10.0 * (accuracy_std < 5)
+        + 10.0 * ((opponent_elo > 2400) & (accuracy > 88))
+    )
+
+
+_suspicion_kernel = (njit(cache=True, nogil=True)(_suspicion_loop)
+                     if NUMBA_AVAILABLE else _suspicion_masks)
+
 
 class EnhancedPlayerAnalyzer:
     """
@@ -121,38 +337,154 @@ class EnhancedPlayerAnalyzer:
     - Caching for efficiency
     """
     
-    def __init__(self, config: Dict, use_lichess: bool = True, use_chess_com: bool = True, cache_dir: str = "cache/analysis"):
+    def __init__(self, config: Dict, use_lichess: bool = True, use_chess_com: bool = True,
+                 cache_dir: Optional[str] = "cache/analysis"):
         self.config = config
         self.use_lichess = use_lichess
         self.use_chess_com = use_chess_com
-        self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(exist_ok=True, parents=True)
         self.lichess_url = "https://lichess.org/api/games"
-        self.analysis_cache = {}
-        self._load_cache()
+        # Shared session: Lichess requests from all analysis threads reuse
+        # pooled keep-alive connections instead of a new TLS handshake each
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=HTTP_POOL_SIZE,
+                                                   pool_maxsize=HTTP_POOL_SIZE))
+        self.session.headers.update({'Accept-Encoding': 'gzip'})
+        # Stockfish processes: one per analysis thread while engines are kept
+        # (see _local_engine), all of them closed by close_engines()
+        self._engine_state = threading.local()
+        self._engines = []
+        self._engine_lock = threading.Lock()
+        self._keep_engines = False
+        # Position (EPD) -> engine centipawns, shared across games so common
+        # openings are searched once; trimmed least recently used first
+        self._position_cache = OrderedDict()
+        self._position_lock = threading.Lock()
+        self._progress_time = 0.0  # time.monotonic() of the last progress redraw
+        # SQLite analysis cache shared by the analysis threads (None: no cache)
+        self._cache_lock = threading.Lock()
+        self._cache_db = None
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(exist_ok=True, parents=True)
+            self._load_cache()
     
     def _load_cache(self):
-        """Load analysis cache from disk"""
-        cache_file = self.cache_dir / "analyses.json"
-        if cache_file.exists():
+        """Open the analysis cache database"""
+        # An older analyses.json is not imported: its entries are keyed by MD5
+        # game hashes, which no _get_game_hash lookup can produce any more
+        try:
+            db = sqlite3.connect(str(self.cache_dir / "analyses.db"), check_same_thread=False)
+            # WAL keeps readers and the writer from blocking each other
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute("CREATE TABLE IF NOT EXISTS analyses (hash TEXT PRIMARY KEY, payload TEXT NOT NULL)")
+            db.commit()
+        except sqlite3.Error:
+            return
+        self._cache_db = db
+    
+    def _get_cached(self, game_hash: str) -> Optional[Dict]:
+        """Return the cached analysis dict for a game hash, if any"""
+        if self._cache_db is None:
+            return None
+        with self._cache_lock:
             try:
-                with open(cache_file, 'r') as f:
-                    self.analysis_cache = json.load(f)
-            except:
+                row = self._cache_db.execute(
+                    "SELECT payload FROM analyses WHERE hash = ?", (game_hash,)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+        return json.loads(row[0]) if row else None
+    
+    def _store_cache(self, game_hash: str, data: Dict):
+        """Write one analysis to the cache database"""
+        self._store_cache_many([(game_hash, data)])
+    
+    def _store_cache_many(self, items: List[Tuple[str, Dict]]):
+        """Write (game_hash, analysis dict) pairs in a single transaction"""
+        if self._cache_db is None or not items:
+            return
+        rows = [(game_hash, json.dumps(data)) for game_hash, data in items]
+        with self._cache_lock:
+            try:
+                self._cache_db.executemany(
+                    "INSERT OR REPLACE INTO analyses (hash, payload) VALUES (?, ?)", rows
+                )
+                self._cache_db.commit()
+            except sqlite3.Error:
                 pass
     
-    def _save_cache(self):
-        """Save analysis cache to disk"""
-        cache_file = self.cache_dir / "analyses.json"
+    @contextmanager
+    def _local_engine(self, sf_path: str):
+        """
+        Yield a configured Stockfish engine for the calling thread.
+        
+        While _keep_engines is set (during analyze_games_fast and in worker
+        processes) each thread starts and configures one engine and reuses
+        it for every game; otherwise the engine lives for a single call.
+        """
+        engine = getattr(self._engine_state, 'engine', None)
+        if engine is not None:
+            yield engine
+            return
+        
+        print(f"[LOCAL_EVAL] Starting Stockfish from: {sf_path}", file=sys.stderr)
+        engine = chess.engine.SimpleEngine.popen_uci(sf_path)
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(self.analysis_cache, f)
-        except:
-            pass
+            analysis_config = self.config.get('analysis', {})
+            engine.configure({
+                "Threads": analysis_config.get('threads', 1),
+                "Hash": analysis_config.get('hash_size', 256)
+            })
+        except Exception:
+            pass  # Engine defaults still work
+        
+        if not self._keep_engines:
+            try:
+                yield engine
+            finally:
+                try:
+                    engine.quit()
+                except:
+                    pass
+            return
+        
+        self._engine_state.engine = engine
+        with self._engine_lock:
+            self._engines.append(engine)
+        yield engine
+    
+    def close_engines(self):
+        """Quit every Stockfish process kept for reuse"""
+        with self._engine_lock:
+            engines, self._engines = self._engines, []
+        for engine in engines:
+            try:
+                engine.quit()
+            except:
+                pass
+        # Threads that outlive this call start a fresh engine next time
+        self._engine_state = threading.local()
+    
+    def _cached_position(self, key: str) -> Optional[int]:
+        """Return the remembered engine centipawns for a position, if any"""
+        with self._position_lock:
+            cp = self._position_cache.get(key)
+            if cp is not None:
+                self._position_cache.move_to_end(key)
+            return cp
+    
+    def _remember_position(self, key: str, cp: int):
+        """Remember a position's engine centipawns, evicting the oldest entry when full"""
+        with self._position_lock:
+            self._position_cache[key] = cp
+            if len(self._position_cache) > POSITION_CACHE_SIZE:
+                self._position_cache.popitem(last=False)
     
     def _get_game_hash(self, game_pgn: str) -> str:
         """Generate unique hash for game to enable caching"""
-        return hashlib.md5(game_pgn.encode()).hexdigest()
+        # 128-bit BLAKE2b: same hex key length as MD5, cheaper on short PGNs
+        return hashlib.blake2b(game_pgn.encode(), digest_size=16).hexdigest()
     
     def analyze_games_fast(self, games: List, username: str, max_workers: int = 4) -> Dict:
         """
@@ -174,31 +506,92 @@ class EnhancedPlayerAnalyzer:
         
         start_time = time.time()
         analyses = []
+        fresh = []  # (game_hash, analysis) pairs written to the cache at the end
+        completed = 0
         
-        # First pass: Get cached or cloud analyses in parallel
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(self._analyze_single_game, game, username): game 
-                for game in games
-            }
+        def record(analysis, game_hash=None):
+            # game_hash is given for fresh analyses, which are cached under it
+            nonlocal completed
+            if analysis:
+                analyses.append(analysis)
+                if game_hash is not None:
+                    fresh.append((game_hash, analysis))
+            completed += 1
+            self._print_progress(completed, len(games))
+        
+        # First pass: serve cached analyses, split the rest by workload.
+        # Lichess lookups are network-bound and stay on threads; heuristic and
+        # local engine work is CPU-bound Python and goes to worker processes.
+        io_bound = []
+        cpu_bound = []
+        for game in games:
+            game_pgn = str(game)  # Convert game to PGN string
+            game_hash = self._get_game_hash(game_pgn)
+            cached = self._get_cached(game_hash)
+            if cached is not None:
+                record(self._dict_to_analysis(cached))
+            elif self.use_lichess and "lichess.org" in game.headers.get("Link", ""):
+                io_bound.append((game, game_pgn, game_hash))
+            else:
+                cpu_bound.append((game, game_pgn, game_hash))
+        
+        # One batched export request per LICHESS_EXPORT_BATCH games instead
+        # of a request per game
+        lichess_evals = {}
+        if io_bound:
+            lichess_evals = self._get_lichess_evaluations_batch(
+                [_lichess_game_id(game.headers) for game, _, _ in io_bound]
+            )
+        
+        config_key = json.dumps(self.config, sort_keys=True, default=str)
+        futures = {}
+        retry = {}
+        processes = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 and cpu_bound else None
+        self._keep_engines = True
+        try:
+            if processes is not None:
+                # Submitted before any analysis thread starts, so worker
+                # processes are never forked while threads hold locks
+                for game, game_pgn, game_hash in cpu_bound:
+                    # Game trees are not reliably picklable, so workers get PGN text
+                    future = processes.submit(_analyze_game_v3, game_pgn, username, game_hash,
+                                              config_key, self.use_lichess, self.use_chess_com)
+                    futures[future] = (game, game_pgn, game_hash)
+                cpu_bound = []
             
-            completed = 0
-            for future in as_completed(futures):
-                try:
-                    analysis = future.result()
-                    if analysis:
-                        analyses.append(analysis)
-                except Exception as e:
-                    print(f"\n  [ERROR] Error analyzing game: {str(e)}")
-                finally:
-                    completed += 1
-                    if len(games) > 0:
-                        progress = int(completed / len(games) * 50)
-                    else:
-                        progress = 0
-                    # Use ASCII-safe progress bar for Windows compatibility
-                    bar = '=' * progress + '-' * (50 - progress)
-                    print(f"\r  Progress: [{bar}] {completed}/{len(games)}", end='')
+            with ThreadPoolExecutor(max_workers=max_workers) as threads:
+                for game, game_pgn, game_hash in io_bound + cpu_bound:
+                    prefetched = lichess_evals.get(_lichess_game_id(game.headers))
+                    future = threads.submit(self._analyze_game, game, username, game_hash, prefetched)
+                    futures[future] = (game, game_pgn, game_hash)
+                
+                for future in as_completed(futures):
+                    game, game_pgn, game_hash = futures[future]
+                    try:
+                        record(future.result(), game_hash)
+                    except BrokenProcessPool:
+                        # Worker processes could not start (e.g. no __main__ guard
+                        # under spawn); analyze these games on threads instead
+                        retry[threads.submit(self._analyze_game, game, username, game_hash)] = game_hash
+                    except Exception as e:
+                        print(f"\n  [ERROR] Error analyzing game: {str(e)}")
+                        record(None)
+                
+                for future in as_completed(retry):
+                    try:
+                        record(future.result(), retry[future])
+                    except Exception as e:
+                        print(f"\n  [ERROR] Error analyzing game: {str(e)}")
+                        record(None)
+        finally:
+            if processes is not None:
+                processes.shutdown()
+            self._keep_engines = False
+            self.close_engines()
+            # Score every fresh game in one vectorized pass, then write them
+            # in one cache transaction once the pools have drained (or failed)
+            self._score_suspicion_batch([analysis for _, analysis in fresh])
+            self._store_cache_many([(game_hash, analysis.asdict()) for game_hash, analysis in fresh])
         
         print()  # New line
         
@@ -210,32 +603,69 @@ class EnhancedPlayerAnalyzer:
         
         return results
     
-    def _analyze_single_game(self, game: chess.pgn.Game, username: str) -> Optional[GameAnalysisV3]:
-        """Analyze a single game with caching"""
-        try:
+    def _print_progress(self, completed: int, total: int):
+        """Redraw the progress bar, at most every PROGRESS_INTERVAL seconds"""
+        # Completions can arrive far faster than a terminal redraw is useful;
+        # the final state is always drawn
+        now = time.monotonic()
+        if completed < total and now - self._progress_time < PROGRESS_INTERVAL:
+            return
+        self._progress_time = now
+        
+        if total > 0:
+            progress = int(completed / total * 50)
+        else:
+            progress = 0
+        # Use ASCII-safe progress bar for Windows compatibility
+        bar = '=' * progress + '-' * (50 - progress)
+        print(f"\r  Progress: [{bar}] {completed}/{total}", end='', flush=True)
+    
+    def _analyze_single_game(self, game: chess.pgn.Game, username: str,
+                             game_pgn: Optional[str] = None) -> Optional[GameAnalysisV3]:
+        """Analyze a single game with caching
+        
+        game_pgn is the game's PGN text (str(game)) when the caller already
+        has it; otherwise the game is exported once here for the cache key.
+        """
+        if game_pgn is None:
             game_pgn = str(game)  # Convert game to PGN string
-            game_hash = self._get_game_hash(game_pgn)
-            
-            # Check cache first
-            if game_hash in self.analysis_cache:
-                return self._dict_to_analysis(self.analysis_cache[game_hash])
-            
-            # Get game metadata
-            white = game.headers.get("White", "").lower()
-            black = game.headers.get("Black", "").lower()
-            result = game.headers.get("Result", "*")
-            white_elo = int(game.headers.get("WhiteElo", "0") or "0")
-            black_elo = int(game.headers.get("BlackElo", "0") or "0")
-            time_control = game.headers.get("TimeControl", "")
+        game_hash = self._get_game_hash(game_pgn)
+        
+        # Check cache first
+        cached = self._get_cached(game_hash)
+        if cached is not None:
+            return self._dict_to_analysis(cached)
+        
+        game_analysis = self._analyze_game(game, username, game_hash)
+        if game_analysis is not None:
+            self._score_suspicion_batch([game_analysis])
+            self._store_cache(game_hash, game_analysis.asdict())
+        return game_analysis
+    
+    def _analyze_game(self, game: chess.pgn.Game, username: str, game_hash: str,
+                      lichess_evals: Optional[List[Dict]] = None) -> Optional[GameAnalysisV3]:
+        """Analyze a single game, bypassing the cache
+        
+        lichess_evals are the game's prefetched Lichess evaluations, if any.
+        """
+        try:
+            # Get game metadata (plain dict: Headers lookups go through Python code)
+            headers = dict(game.headers)
+            white = headers.get("White", "").lower()
+            black = headers.get("Black", "").lower()
+            result = headers.get("Result", "*")
+            white_elo = int(headers.get("WhiteElo", "0") or "0")
+            black_elo = int(headers.get("BlackElo", "0") or "0")
+            time_control = headers.get("TimeControl", "")
             
             is_player_white = white == username.lower()
             player_elo = white_elo if is_player_white else black_elo
             opponent_elo = black_elo if is_player_white else white_elo
-            move_count = len(list(game.mainline_moves()))
             
-            # Extract moves and get evaluations
+            # Extract moves once; the count and every analysis step reuse them
             moves = list(game.mainline_moves())
-            evaluations = self._get_evaluations(game, moves[:100])  # First 100 half-moves for better coverage
+            move_count = len(moves)
+            evaluations = self._get_evaluations(game, moves[:100], lichess_evals)  # First 100 half-moves for better coverage
             
             # Analyze patterns
             game_analysis = GameAnalysisV3(
@@ -250,33 +680,34 @@ class EnhancedPlayerAnalyzer:
             )
             
             # Get timing data if available
-            game_analysis.time_pattern = self._analyze_time_patterns(game, moves, is_player_white)
+            game_analysis.time_pattern = self._analyze_time_patterns(headers, is_player_white)
             
             # Get engine evaluation
-            game_analysis.engine_pattern = self._analyze_engine_matching(evaluations, moves)
-            game_analysis.blunder_analysis = self._analyze_blunders(evaluations, moves, is_player_white)
-            game_analysis.accuracy = self._calculate_accuracy(evaluations, moves)
-            
-            # Determine suspicion
-            game_analysis.is_suspicious, game_analysis.suspicion_score = self._score_suspicion(
-                game_analysis, opponent_elo, move_count
-            )
-            
-            # Cache the analysis
-            self.analysis_cache[game_hash] = asdict(game_analysis)
-            self._save_cache()
+            # One contiguous centipawn array replaces the per-move dicts for
+            # every analysis step; move quality scores feed both engine
+            # matching and accuracy
+            cp = _centipawn_array(evaluations)
+            move_scores = self._calculate_move_scores(cp)
+            game_analysis.engine_pattern = self._analyze_engine_matching(cp, moves, move_scores)
+            game_analysis.blunder_analysis = self._analyze_blunders(cp, moves, is_player_white)
+            game_analysis.accuracy = self._calculate_accuracy(cp, moves, move_scores)
             
+            # Suspicion is scored by the caller, in one batch per run
             return game_analysis
         
         except Exception as e:
             import traceback
             # Log the full traceback for debugging
-            print(f"\nDEBUG: Full error in _analyze_single_game: {type(e).__name__}: {e}")
+            print(f"\nDEBUG: Full error in _analyze_game: {type(e).__name__}: {e}")
             traceback.print_exc()
             return None
     
-    def _get_evaluations(self, game: chess.pgn.Game, moves: List) -> List[Dict]:
-        """Get evaluations for moves using Lichess API or local engine"""
+    def _get_evaluations(self, game: chess.pgn.Game, moves: List,
+                         lichess_evals: Optional[List[Dict]] = None) -> List[Dict]:
+        """Get evaluations for moves using Lichess API or local engine
+        
+        lichess_evals, when given, are used instead of querying Lichess.
+        """
         evaluations = []
         
         import sys
@@ -284,11 +715,22 @@ class EnhancedPlayerAnalyzer:
         # Try Lichess API first (fastest)
         if self.use_lichess:
             print(f"[EVAL] Trying Lichess API...", file=sys.stderr)
-            evaluations = self._get_lichess_evaluations(game)
+            if lichess_evals is not None:
+                evaluations = lichess_evals
+            else:
+                evaluations = self._get_lichess_evaluations(game)
             print(f"[EVAL] Lichess returned {len(evaluations)} evaluations", file=sys.stderr)
         else:
             print(f"[EVAL] Skipping Lichess (use_lichess={self.use_lichess})", file=sys.stderr)
         
+        # Keep partial Lichess evaluations and search only the positions they
+        # miss. Lichess entry i scores the position after ply i + 1, while local
+        # entries score the position before each move, so the tail starts at
+        # the position before move len(evaluations) + 1.
+        if evaluations and len(evaluations) + 1 < len(moves):
+            print(f"[EVAL] Filling {len(evaluations)} Lichess evaluations with local Stockfish", file=sys.stderr)
+            evaluations = evaluations + self._get_local_evaluations(game, moves, start_ply=len(evaluations) + 1)
+        
         # Fall back to local analysis if needed
         if not evaluations or len(evaluations) < len(moves) / 4:  # Need at least 25% coverage
             print(f"[EVAL] Calling local Stockfish ({len(evaluations)} < {len(moves) / 4})", file=sys.stderr)
@@ -312,30 +754,31 @@ class EnhancedPlayerAnalyzer:
         evaluations = []
         try:
             board = chess.Board()
+            popcount = chess.popcount
+            pawn, knight, bishop, rook, queen = PIECE_TYPE_VALUES[chess.PAWN:chess.KING]
             
-            for move in moves[:100]:  # Limit to 100 moves for speed
+            for ply, move in enumerate(moves[:100], 1):  # Limit to 100 moves for speed
                 board.push(move)
                 
-                # Estimate material balance
-                white_material = 0
-                black_material = 0
-                
-                for square in chess.SQUARES:
-                    piece = board.piece_at(square)
-                    if piece:
-                        value = PIECE_VALUES.get(piece.symbol().upper(), 0)
-                        if piece.color == chess.WHITE:
-                            white_material += value
-                        else:
-                            black_material += value
-                
-                material_diff = white_material - black_material
+                # Estimate material balance from the piece bitboards
+                # (kings are worth 0 and left out)
+                white = board.occupied_co[chess.WHITE]
+                black = board.occupied_co[chess.BLACK]
+                material_diff = 0
+                for bitboard, value in (
+                    (board.pawns, pawn),
+                    (board.knights, knight),
+                    (board.bishops, bishop),
+                    (board.rooks, rook),
+                    (board.queens, queen),
+                ):
+                    material_diff += value * (popcount(bitboard & white) - popcount(bitboard & black))
                 
                 # Simple evaluation: material + position adjustments
                 eval_cp = int(material_diff)
                 
                 # Bonus for development (opening phase)
-                if len(list(board.move_stack)) < 20:
+                if ply < 20:
                     # Count developed pieces
                     if board.piece_at(chess.B1) is None:  # Bishop developed
                         eval_cp += 20
@@ -361,12 +804,8 @@ class EnhancedPlayerAnalyzer:
         """Get position evaluations from Lichess Computer Analysis API"""
         try:
             # Get game ID from the game URL/headers
-            link = game.headers.get("Link", "")
-            if "lichess.org" not in link:
-                return []
-            
-            game_id = link.split('/')[-1].split('?')[0]
-            if not game_id or len(game_id) < 8:
+            game_id = _lichess_game_id(game.headers)
+            if game_id is None:
                 return []
             
             # Fetch game analysis from Lichess
@@ -374,38 +813,65 @@ class EnhancedPlayerAnalyzer:
             url = f"https://lichess.org/api/games/{game_id}"
             headers = {"Accept": "application/json"}
             
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=headers, timeout=10)
             
             if response.status_code != 200:
                 return []
             
             game_data = response.json()
-            evals = []
             
             # Extract evaluations from the analysis field if available
-            analysis = game_data.get('analysis', [])
-            if analysis:
-                for move_analysis in analysis:
-                    eval_info = {}
-                    
-                    # Get centipawn evaluation
-                    if 'eval' in move_analysis:
-                        eval_info['centipawns'] = move_analysis['eval']
-                    elif 'mate' in move_analysis:
-                        eval_info['mate'] = move_analysis['mate']
-                        eval_info['centipawns'] = None
-                    else:
-                        continue
-                    
-                    evals.append(eval_info)
-            
-            return evals
+            return _parse_lichess_analysis(game_data.get('analysis', []))
         
         except Exception as e:
             return []
     
-    def _get_local_evaluations(self, game: chess.pgn.Game, moves: List) -> List[Dict]:
-        """Get evaluations using local Stockfish engine - CONFIGURABLE DEPTH VERSION"""
+    def _get_lichess_evaluations_batch(self, game_ids: List[Optional[str]]) -> Dict[str, List[Dict]]:
+        """
+        Get evaluations for many Lichess games via the NDJSON export endpoint
+        
+        Args:
+            game_ids: Lichess game IDs; None entries are skipped
+        
+        Returns:
+            Dictionary of game ID -> evaluations. Games from failed requests
+            are left out, so callers fall back to the per-game lookup.
+        """
+        game_ids = list(dict.fromkeys(gid for gid in game_ids if gid))
+        evals = {}
+        for start in range(0, len(game_ids), LICHESS_EXPORT_BATCH):
+            batch = game_ids[start:start + LICHESS_EXPORT_BATCH]
+            try:
+                response = self.session.post(
+                    "https://lichess.org/api/games/export/_ids",
+                    data=",".join(batch).encode(),
+                    params={"evals": "true", "moves": "false"},
+                    headers={"Accept": "application/x-ndjson"},
+                    stream=True,
+                    timeout=30
+                )
+                with response:
+                    if response.status_code != 200:
+                        continue
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        game_data = json.loads(line)
+                        evals[game_data['id']] = _parse_lichess_analysis(game_data.get('analysis', []))
+                # IDs missing from a complete export are unknown or private games
+                for game_id in batch:
+                    evals.setdefault(game_id, [])
+            except Exception:
+                continue
+        return evals
+    
+    def _get_local_evaluations(self, game: chess.pgn.Game, moves: List, start_ply: int = 0) -> List[Dict]:
+        """Get evaluations using local Stockfish engine - CONFIGURABLE DEPTH VERSION
+        
+        The position before each move is evaluated. With start_ply, the board
+        is first advanced by moves[:start_ply] and only the remaining
+        positions are searched.
+        """
         evaluations = []
         
         try:
@@ -430,13 +896,11 @@ class EnhancedPlayerAnalyzer:
                 print("[LOCAL_EVAL] Stockfish not found", file=sys.stderr)
                 return []
             
-            # Start engine directly
-            engine = None
-            try:
-                print(f"[LOCAL_EVAL] Starting Stockfish from: {sf_path}", file=sys.stderr)
-                engine = chess.engine.SimpleEngine.popen_uci(sf_path)
-                
+            # Engine is started (and configured) once per thread, see _local_engine
+            with self._local_engine(sf_path) as engine:
                 board = chess.Board()
+                for move in moves[:start_ply]:
+                    board.push(move)
                 depth = self.config.get('analysis', {}).get('engine_depth', 16)
                 print(f"[LOCAL_EVAL] Using depth: {depth}", file=sys.stderr)
                 
@@ -450,34 +914,39 @@ class EnhancedPlayerAnalyzer:
                 }
                 time_per_move = time_limits.get(depth, 0.5)
                 print(f"[LOCAL_EVAL] Time per move: {time_per_move}s", file=sys.stderr)
-                print(f"[LOCAL_EVAL] Analyzing {len(moves[:100])} positions", file=sys.stderr)
+                print(f"[LOCAL_EVAL] Analyzing {len(moves[start_ply:100])} positions", file=sys.stderr)
                 
                 # Analyze each position
-                for i, move in enumerate(moves[:100]):  # Limit to 100 moves
+                for i, move in enumerate(moves[start_ply:100], start_ply):  # Limit to 100 moves
                     try:
-                        # Analysis with depth and time limit
-                        limits = chess.engine.Limit(depth=depth, time=time_per_move)
-                        info = engine.analyse(board, limits)
-                        
-                        # Extract evaluation
-                        if info and 'score' in info:
-                            score = info['score']
-                            # Convert to centipawns from white's perspective
-                            cp = score.white().score(mate_score=10000)
+                        # Positions seen in earlier games (shared openings)
+                        # skip the search; EPD leaves out the move counters
+                        key = board.epd()
+                        cp = self._cached_position(key)
+                        if cp is None:
+                            # Analysis with depth and time limit
+                            limits = chess.engine.Limit(depth=depth, time=time_per_move)
+                            info = engine.analyse(board, limits)
                             
-                            evaluations.append({
-                                "centipawns": cp if cp is not None else 0,
-                                "mate": None,
-                                "stockfish": True
-                            })
-                        else:
-                            # No score available
-                            evaluations.append({
-                                "centipawns": 0,
-                                "mate": None,
-                                "stockfish": True
-                            })
+                            # Extract evaluation
+                            cp = 0  # No score available
+                            if info and 'score' in info:
+                                # Convert to centipawns from white's perspective
+                                cp = info['score'].white().score(mate_score=10000)
+                                if cp is None:
+                                    cp = 0
+                            self._remember_position(key, cp)
                         
+                        evaluations.append({
+                            "centipawns": cp,
+                            "mate": None,
+                            "stockfish": True
+                        })
+                        
+                    except chess.engine.EngineTerminatedError:
+                        # Dead engine: drop it so the next game starts a new one
+                        self._engine_state.engine = None
+                        break
                     except Exception as move_error:
                         # Skip this move if analysis fails, but continue with others
                         continue
@@ -485,15 +954,9 @@ class EnhancedPlayerAnalyzer:
                     # Make the move
                     board.push(move)
                 
-                return evaluations if len(evaluations) >= 3 else []
-                
-            finally:
-                # Always close engine
-                if engine:
-                    try:
-                        engine.quit()
-                    except:
-                        pass
+                # A whole game needs a few positions to be usable; a tail
+                # continuing other evaluations does not
+                return evaluations if len(evaluations) >= 3 or start_ply else []
         
         except ImportError:
             # Chess.engine not available
@@ -502,27 +965,20 @@ class EnhancedPlayerAnalyzer:
             # Any error - return empty to trigger fallback
             return []
     
-    def _analyze_time_patterns(self, game: chess.pgn.Game, moves: List, is_player: bool) -> TimePattern:
-        """Analyze move timing patterns"""
+    def _analyze_time_patterns(self, headers: Dict, is_player: bool) -> TimePattern:
+        """Analyze move timing patterns from the game's ClockTimes header"""
         pattern = TimePattern()
         
         try:
             # Get move times from game
-            times = []
-            move_times_str = game.headers.get("ClockTimes", "")
+            move_times_str = headers.get("ClockTimes", "")
             
             if move_times_str:
-                time_parts = move_times_str.split(',')
-                for time_str in time_parts:
-                    try:
-                        # Convert time string to seconds
-                        parts = time_str.strip().split(':')
-                        if len(parts) == 3:
-                            hours, mins, secs = parts
-                            total_secs = int(hours) * 3600 + int(mins) * 60 + int(secs)
-                            times.append(total_secs)
-                    except:
-                        continue
+                # Convert every time string to seconds in one pass
+                clock_parts = _CLOCK_TIME.findall(move_times_str)
+                if not clock_parts:
+                    return pattern
+                times = np.array(clock_parts, dtype=np.int64) @ _CLOCK_SECONDS
                 
                 # Filter for player's moves only
                 if is_player:
@@ -530,45 +986,55 @@ class EnhancedPlayerAnalyzer:
                 else:
                     player_times = times[1::2]
                 
-                if player_times:
-                    pattern.avg_time = statistics.mean(player_times)
-                    pattern.median_time = statistics.median(player_times)
+                if player_times.size:
+                    pattern.avg_time = float(player_times.mean())
+                    pattern.median_time = float(np.median(player_times))
                     
-                    if len(player_times) > 1:
-                        pattern.std_dev = statistics.stdev(player_times)
+                    if player_times.size > 1:
+                        pattern.std_dev = float(player_times.std(ddof=1))
                         pattern.time_coefficient_variation = pattern.std_dev / pattern.avg_time if pattern.avg_time > 0 else 0
                     
                     # Check for suspicious consistency (CV < 0.3 = very consistent)
                     pattern.suspicious_consistency = pattern.time_coefficient_variation < 0.3
                     
                     # Count rapid responses
-                    pattern.rapid_responses = len([t for t in player_times if t < 1])
+                    pattern.rapid_responses = int(np.count_nonzero(player_times < 1))
         
         except:
             pass
         
         return pattern
     
-    def _analyze_engine_matching(self, evaluations: List[Dict], moves: List) -> EnginePattern:
-        """Analyze how often moves match engine recommendations"""
+    def _analyze_engine_matching(self, evaluations: List[Dict], moves: List,
+                                 move_scores: Optional[List[float]] = None) -> EnginePattern:
+        """
+        Analyze how often moves match engine recommendations
+        
+        Args:
+            evaluations: Position evaluations (dicts or _centipawn_array)
+            moves: Moves of the game
+            move_scores: _calculate_move_scores(evaluations), if already computed
+        """
         pattern = EnginePattern()
         
         try:
-            if not evaluations or not moves or len(evaluations) < 2:
+            if not moves or len(evaluations) < 2:
                 return pattern
             
             # Calculate move quality scores based on evaluation changes
-            move_scores = self._calculate_move_scores(evaluations)
+            if move_scores is None:
+                move_scores = self._calculate_move_scores(evaluations)
             
-            if not move_scores:
+            scores = np.asarray(move_scores, dtype=np.float64)
+            if not scores.size:
                 return pattern
             
             # Engine matching rates based on move quality
-            excellent_moves = len([s for s in move_scores if s >= 90])
-            good_moves = len([s for s in move_scores if s >= 80])
-            okay_moves = len([s for s in move_scores if s >= 70])
+            excellent_moves = int(np.count_nonzero(scores >= 90))
+            good_moves = int(np.count_nonzero(scores >= 80))
+            okay_moves = int(np.count_nonzero(scores >= 70))
             
-            total = len(move_scores)
+            total = scores.size
             
             pattern.top_1_match_rate = (excellent_moves / total * 100) if total > 0 else 0.0
             pattern.top_3_match_rate = min(100.0, (excellent_moves + good_moves) / total * 100) if total > 0 else 0.0
@@ -583,62 +1049,56 @@ class EnhancedPlayerAnalyzer:
         return pattern
     
     def _analyze_blunders(self, evaluations: List[Dict], moves: List, is_player: bool) -> BlunderAnalysis:
-        """Analyze blunder patterns"""
+        """Analyze blunder patterns (evaluations: dicts or _centipawn_array)"""
         analysis = BlunderAnalysis()
         
         try:
-            if not evaluations:
+            if len(evaluations) == 0:
                 return analysis
             
-            blunder_costs = []
+            # Centipawns per position; mate positions are NaN, which drops
+            # out of every comparison below
+            cp = _centipawn_array(evaluations)
             
-            for i in range(0, len(evaluations) - 1, 2):
-                if is_player:
-                    # Player's move (even indices)
-                    before = evaluations[i].get("centipawns", 0)
-                    after = evaluations[i+1].get("centipawns", 0)
-                else:
-                    # Player's move (odd indices)
-                    if i + 1 < len(evaluations):
-                        before = evaluations[i].get("centipawns", 0)
-                        after = evaluations[i+1].get("centipawns", 0)
-                    else:
-                        continue
-                
-                if before is not None and after is not None:
-                    loss = after - before
-                    
-                    if loss > 50:
-                        analysis.total_blunders += 1
-                        blunder_costs.append(loss)
-                        
-                        if loss > 200:
-                            analysis.critical_blunders += 1
+            # Moves are scored in (0, 1), (2, 3), ... pairs for either colour
+            player_moves = len(evaluations) // 2
+            losses = cp[1:2 * player_moves:2] - cp[0:2 * player_moves:2]
+            blunder_costs = losses[losses > 50]
             
-            if evaluations:
-                player_moves = len(evaluations) // 2
-                analysis.blunder_rate = (analysis.total_blunders / player_moves * 100) if player_moves > 0 else 0
+            analysis.total_blunders = int(blunder_costs.size)
+            analysis.critical_blunders = int(np.count_nonzero(blunder_costs > 200))
+            analysis.blunder_rate = (analysis.total_blunders / player_moves * 100) if player_moves > 0 else 0
             
-            if blunder_costs:
-                analysis.average_blunder_cost = statistics.mean(blunder_costs)
+            if blunder_costs.size:
+                analysis.average_blunder_cost = float(blunder_costs.mean())
         
         except:
             pass
         
         return analysis
     
-    def _calculate_accuracy(self, evaluations: List[Dict], moves: List) -> AccuracyMetrics:
-        """Calculate accuracy by game phase - properly evaluates move quality"""
+    def _calculate_accuracy(self, evaluations: List[Dict], moves: List,
+                            move_scores: Optional[List[float]] = None) -> AccuracyMetrics:
+        """
+        Calculate accuracy by game phase - properly evaluates move quality
+        
+        Args:
+            evaluations: Position evaluations (dicts or _centipawn_array)
+            moves: Moves of the game
+            move_scores: _calculate_move_scores(evaluations), if already computed
+        """
         metrics = AccuracyMetrics()
         
         try:
-            if not evaluations or len(evaluations) < 3:
+            if len(evaluations) < 3:
                 return metrics
             
             # Calculate move quality scores (0-100)
-            move_scores = self._calculate_move_scores(evaluations)
+            if move_scores is None:
+                move_scores = self._calculate_move_scores(evaluations)
             
-            if not move_scores:
+            scores = np.asarray(move_scores, dtype=np.float64)
+            if not scores.size:
                 return metrics
             
             # Use only the moves that have evaluations
@@ -650,20 +1110,20 @@ class EnhancedPlayerAnalyzer:
             endgame_start = max(40, num_moves * 2 // 3)
             
             # Calculate accuracy for each phase
-            opening_scores = move_scores[:opening_end]
-            middlegame_scores = move_scores[opening_end:endgame_start]
-            endgame_scores = move_scores[endgame_start:]
+            opening_scores = scores[:opening_end]
+            middlegame_scores = scores[opening_end:endgame_start]
+            endgame_scores = scores[endgame_start:]
             
-            metrics.opening_accuracy = statistics.mean(opening_scores) if opening_scores else 0.0
-            metrics.middlegame_accuracy = statistics.mean(middlegame_scores) if middlegame_scores else 0.0
-            metrics.endgame_accuracy = statistics.mean(endgame_scores) if endgame_scores else 0.0
+            metrics.opening_accuracy = float(opening_scores.mean()) if opening_scores.size else 0.0
+            metrics.middlegame_accuracy = float(middlegame_scores.mean()) if middlegame_scores.size else 0.0
+            metrics.endgame_accuracy = float(endgame_scores.mean()) if endgame_scores.size else 0.0
             
             # Overall accuracy
-            metrics.overall_accuracy = statistics.mean(move_scores) if move_scores else 0.0
+            metrics.overall_accuracy = float(scores.mean())
             
             # Consistency (lower = more consistent)
-            if len(move_scores) > 1:
-                metrics.consistency_std_dev = statistics.stdev(move_scores)
+            if scores.size > 1:
+                metrics.consistency_std_dev = float(scores.std(ddof=1))
         
         except Exception as e:
             pass
@@ -674,53 +1134,15 @@ class EnhancedPlayerAnalyzer:
         """
         Calculate quality score (0-100) for each move based on evaluation changes.
         Score based on: how much the player's move preserved/improved position
+        
+        evaluations may be dicts or their _centipawn_array.
         """
-        scores = []
+        if len(evaluations) < 2:
+            return []
         try:
-            for i in range(len(evaluations) - 1):
-                before = evaluations[i].get("centipawns")
-                after = evaluations[i + 1].get("centipawns")
-                
-                # Handle mate scores
-                if before is None or after is None:
-                    scores.append(50.0)  # Neutral score for mate positions
-                    continue
-                
-                # Evaluate move quality based on position change
-                # Positive change means player improved position (or opponent worsened it)
-                change = before - after  # From white's perspective
-                
-                if change >= 100:
-                    # Excellent move (>1 pawn improvement)
-                    score = 100.0
-                elif change >= 50:
-                    # Very good move (0.5+ pawn improvement)
-                    score = 90.0
-                elif change >= 25:
-                    # Good move (0.25+ pawn improvement)
-                    score = 80.0
-                elif change >= 0:
-                    # Okay move (no material loss)
-                    score = 70.0
-                elif change >= -25:
-                    # Inaccuracy (0.25 pawn loss)
-                    score = 55.0
-                elif change >= -50:
-                    # Mistake (0.5 pawn loss)
-                    score = 40.0
-                elif change >= -100:
-                    # Blunder (1+ pawn loss)
-                    score = 20.0
-                else:
-                    # Major blunder (>1 pawn loss)
-                    score = 5.0
-                
-                scores.append(score)
-        
+            return _move_scores_kernel(_centipawn_array(evaluations)).tolist()
         except Exception as e:
-            pass
-        
-        return scores
+            return []
     
     def _calculate_phase_accuracy(self, evals: List[Dict]) -> float:
         """Calculate accuracy for a phase - DEPRECATED, use move_scores instead"""
@@ -739,48 +1161,34 @@ class EnhancedPlayerAnalyzer:
         except:
             return 0.0
     
-    def _score_suspicion(self, analysis: GameAnalysisV3, opponent_elo: int, move_count: int) -> Tuple[bool, float]:
+    def _score_suspicion_batch(self, analyses: List[GameAnalysisV3]):
         """
-        Multi-layer suspicion scoring
-        Returns (is_suspicious, score)
+        Multi-layer suspicion scoring for a batch of games
+        Sets is_suspicious and suspicion_score on each analysis
         """
+        if not analyses:
+            return
         
-        score = 0.0
-        
-        # Factor 1: Engine matching (max 40 points)
-        if analysis.engine_pattern.top_1_match_rate > 92:
-            score += 30
-        elif analysis.engine_pattern.top_1_match_rate > 85:
-            score += 15
-        
-        # Factor 2: Time consistency (max 25 points)
-        if analysis.time_pattern.suspicious_consistency:
-            score += 15
-        
-        if analysis.time_pattern.time_coefficient_variation < 0.2:
-            score += 10
-        
-        # Factor 3: Blunder rate (max 20 points)
-        if analysis.blunder_analysis.blunder_rate < 2:  # Very low blunder rate
-            score += 10
-        
-        if analysis.blunder_analysis.critical_blunders == 0:
-            score += 10
-        
-        # Factor 4: Accuracy variance (max 15 points)
-        if analysis.accuracy.consistency_std_dev < 5:
-            score += 10
-        
-        # Rating context (max 20 points)
-        if opponent_elo > 2400 and analysis.accuracy.overall_accuracy > 88:
-            score += 10  # Extremely high accuracy vs strong opposition
-        
-        is_suspicious = score > 60
+        metrics = np.array([
+            (a.engine_pattern.top_1_match_rate, a.time_pattern.suspicious_consistency,
+             a.time_pattern.time_coefficient_variation, a.blunder_analysis.blunder_rate,
+             a.blunder_analysis.critical_blunders, a.accuracy.consistency_std_dev,
+             a.opponent_elo, a.accuracy.overall_accuracy)
+            for a in analyses
+        ], dtype=np.float64)
+        scores = _suspicion_kernel(*np.ascontiguousarray(metrics.T))
         
-        return is_suspicious, score
+        for analysis, score in zip(analyses, scores.tolist()):
+            analysis.suspicion_score = score
+            analysis.is_suspicious = score > 60
     
     def _compile_analysis_results(self, analyses: List[GameAnalysisV3], username: str) -> Dict:
-        """Compile all analyses into comprehensive results"""
+        """
+        Compile all analyses into comprehensive results
+        
+        game_analyses holds the GameAnalysisV3 objects themselves rather than
+        dict copies; use GameAnalysisV3.asdict to serialize them
+        """
         
         if not analyses:
             return {
@@ -792,24 +1200,30 @@ class EnhancedPlayerAnalyzer:
         
         # Calculate aggregate metrics
         total_games = len(analyses)
-        avg_suspicion = statistics.mean([a.suspicion_score for a in analyses])
-        suspicious_games = len([a for a in analyses if a.is_suspicious])
+        # One pass over the games gathers every metric; columns are then
+        # reduced in NumPy
+        metrics = np.array([
+            (a.suspicion_score, a.is_suspicious, a.engine_pattern.top_1_match_rate,
+             a.blunder_analysis.blunder_rate, a.accuracy.overall_accuracy,
+             a.time_pattern.time_coefficient_variation)
+            for a in analyses
+        ], dtype=np.float64)
+        suspicion, is_suspicious, engine_match, blunder_rate, accuracy, time_cv = metrics.T
+        
+        avg_suspicion = float(suspicion.mean())
+        suspicious_games = int(np.count_nonzero(is_suspicious))
         
         # Pattern aggregates
-        avg_engine_match = statistics.mean([a.engine_pattern.top_1_match_rate for a in analyses])
-        avg_blunder_rate = statistics.mean([a.blunder_analysis.blunder_rate for a in analyses])
+        avg_engine_match = float(engine_match.mean())
+        avg_blunder_rate = float(blunder_rate.mean())
         
         # Average accuracy - handle case where no games have accuracy > 0
-        accuracy_values = [a.accuracy.overall_accuracy for a in analyses if a.accuracy.overall_accuracy > 0]
-        avg_accuracy = statistics.mean(accuracy_values) if accuracy_values else 0
+        accuracy = accuracy[accuracy > 0]
+        avg_accuracy = float(accuracy.mean()) if accuracy.size else 0
         
         # Time pattern consistency
-        time_coefficients = [
-            a.time_pattern.time_coefficient_variation 
-            for a in analyses 
-            if a.time_pattern.time_coefficient_variation > 0
-        ]
-        avg_time_consistency = statistics.mean(time_coefficients) if time_coefficients else 0
+        time_cv = time_cv[time_cv > 0]
+        avg_time_consistency = float(time_cv.mean()) if time_cv.size else 0
         
         return {
             'username': username,
@@ -820,40 +1234,85 @@ class EnhancedPlayerAnalyzer:
             'avg_blunder_rate': avg_blunder_rate,
             'avg_accuracy': avg_accuracy,
             'avg_time_consistency': avg_time_consistency,
-            'game_analyses': [asdict(a) for a in analyses],
+            'game_analyses': analyses,
             'analysis_timestamp': datetime.now().isoformat()
         }
     
     def _dict_to_analysis(self, data: Dict) -> GameAnalysisV3:
         """Convert dict back to GameAnalysisV3 object"""
         try:
+            scalars = _analysis_scalars({**ANALYSIS_SCALAR_DEFAULTS, **data})
             return GameAnalysisV3(
-                game_id=data.get('game_id', ''),
-                white=data.get('white', ''),
-                black=data.get('black', ''),
-                result=data.get('result', ''),
-                player_color=data.get('player_color', ''),
-                time_pattern=TimePattern(**data.get('time_pattern', {})),
-                engine_pattern=EnginePattern(**data.get('engine_pattern', {})),
-                blunder_analysis=BlunderAnalysis(**data.get('blunder_analysis', {})),
-                accuracy=AccuracyMetrics(**data.get('accuracy', {})),
-                opponent_elo=data.get('opponent_elo', 0),
-                time_control=data.get('time_control', ''),
-                move_count=data.get('move_count', 0),
-                is_suspicious=data.get('is_suspicious', False),
-                suspicion_score=data.get('suspicion_score', 0.0),
-                reason=data.get('reason', '')
+                *scalars[:5],
+                TimePattern(**data.get('time_pattern', _EMPTY_DICT)),
+                EnginePattern(**data.get('engine_pattern', _EMPTY_DICT)),
+                BlunderAnalysis(**data.get('blunder_analysis', _EMPTY_DICT)),
+                AccuracyMetrics(**data.get('accuracy', _EMPTY_DICT)),
+                *scalars[5:]
             )
-        except:
+        except (TypeError, KeyError):
             return None
 
 
+@lru_cache(maxsize=1)
+def _worker_analyzer(config_key: str, use_lichess: bool, use_chess_com: bool) -> EnhancedPlayerAnalyzer:
+    """Process-local analyzer, built once per worker for a given config."""
+    # The parent process owns the cache; workers only compute
+    analyzer = EnhancedPlayerAnalyzer(json.loads(config_key), use_lichess=use_lichess,
+                                      use_chess_com=use_chess_com, cache_dir=None)
+    # Keep one engine for the worker's lifetime. python-chess runs engines on
+    # non-daemon threads, so they must be quit before the worker joins its
+    # threads on exit; multiprocessing runs exit finalizers just before that.
+    analyzer._keep_engines = True
+    multiprocessing.util.Finalize(analyzer, analyzer.close_engines, exitpriority=0)
+    return analyzer
+
+
+def _analyze_game_v3(pgn_text: str, username: str, game_hash: str, config_key: str,
+                     use_lichess: bool, use_chess_com: bool) -> Optional[GameAnalysisV3]:
+    """
+    Process-pool worker for EnhancedPlayerAnalyzer.analyze_games_fast.
+    
+    Args:
+        pgn_text: Game as PGN text
+        username: Player's username
+        game_hash: Cache key of the game, used as its game_id
+        config_key: Analyzer configuration serialized as sorted JSON
+        use_lichess, use_chess_com: Analyzer source flags
+    
+    Returns:
+        GameAnalysisV3, or None if the game could not be analyzed
+    """
+    game = chess.pgn.read_game(io.StringIO(pgn_text))
+    analyzer = _worker_analyzer(config_key, use_lichess, use_chess_com)
+    return analyzer._analyze_game(game, username, game_hash)
+
+
+# Report labels: a value of at least BOUNDS[k - 1] and below BOUNDS[k]
+# gets LABELS[k]
+ASSESSMENT_BOUNDS = (30, 50, 70)
+ASSESSMENT_LABELS = (
+    "[CLEAN] - No significant indicators of assistance",
+    "[CAUTION] - Some minor patterns worth noting",
+    "[SUSPICIOUS] - Multiple indicators present",
+    "[HIGHLY SUSPICIOUS] - Strong indicators of potential assistance",
+)
+ACCURACY_FLAG_BOUNDS = (60, 75, 85)
+ACCURACY_FLAG_LABELS = ("🟢 NORMAL", "🟡 MODERATE", "🟠 HIGH", "🔴 SUSPICIOUS")
+
+# Report section rules
+_SEP_EQ = "=" * 80
+_SEP_DASH = "-" * 80
+
+
 def display_enhanced_analysis(results: Dict, username: str):
     """Display comprehensive analysis results"""
+    # The report is assembled line by line and written out in one call
+    out: List[str] = []
     
-    print("\n" + "="*80)
-    print(f"[ANALYSIS] ENHANCED PLAYER ANALYSIS v3.0 - {username.upper()}")
-    print(f"Timestamp: {results.get('analysis_timestamp', 'N/A')}")
+    out.append("\n" + _SEP_EQ)
+    out.append(f"[ANALYSIS] ENHANCED PLAYER ANALYSIS v3.0 - {username.upper()}")
+    out.append(f"Timestamp: {results.get('analysis_timestamp', 'N/A')}")
     
     # Show platform breakdown if available
     platform_breakdown = results.get('platform_breakdown', {})
@@ -863,105 +1322,99 @@ def display_enhanced_analysis(results: Dict, username: str):
             for p, c in platform_breakdown.items() 
             if c > 0
         ])
-        print(f"Sources: {sources}")
+        out.append(f"Sources: {sources}")
     
-    print("="*80)
+    out.append(_SEP_EQ)
     
     games_analyzed = results.get('games_analyzed', 0)
     suspicion_score = results.get('suspicion_score', 0)
     suspicious_games = results.get('suspicious_games', 0)
+    avg_engine_match = results.get('avg_engine_match_rate', 0)
+    avg_blunder_rate = results.get('avg_blunder_rate', 0)
+    avg_accuracy = results.get('avg_accuracy', 0)
+    avg_time_consistency = results.get('avg_time_consistency', 0)
     
-    print(f"\n[ASSESSMENT] OVERALL ASSESSMENT")
-    print("-"*80)
-    print(f"Games Analyzed: {games_analyzed}")
-    print(f"Average Suspicion Score: {suspicion_score:.1f}/100")
+    out.append(f"\n[ASSESSMENT] OVERALL ASSESSMENT")
+    out.append(_SEP_DASH)
+    out.append(f"Games Analyzed: {games_analyzed}")
+    out.append(f"Average Suspicion Score: {suspicion_score:.1f}/100")
     if games_analyzed > 0:
         percentage = suspicious_games/games_analyzed*100
-        print(f"Suspicious Games Detected: {suspicious_games}/{games_analyzed} ({percentage:.1f}%)")
+        out.append(f"Suspicious Games Detected: {suspicious_games}/{games_analyzed} ({percentage:.1f}%)")
     else:
-        print(f"Suspicious Games Detected: 0/0 (No games analyzed successfully)")
+        out.append(f"Suspicious Games Detected: 0/0 (No games analyzed successfully)")
     
     # Assessment
-    if suspicion_score < 30:
-        assessment = "[CLEAN] - No significant indicators of assistance"
-    elif suspicion_score < 50:
-        assessment = "[CAUTION] - Some minor patterns worth noting"
-    elif suspicion_score < 70:
-        assessment = "[SUSPICIOUS] - Multiple indicators present"
-    else:
-        assessment = "[HIGHLY SUSPICIOUS] - Strong indicators of potential assistance"
-    
-    print(f"Assessment: {assessment}")
-    
-    print(f"\n[METRICS] DETAILED METRICS")
-    print("-"*80)
-    print(f"Average Engine Match Rate: {results.get('avg_engine_match_rate', 0):.1f}%")
-    print(f"Average Blunder Rate: {results.get('avg_blunder_rate', 0):.1f}%")
-    print(f"Average Accuracy: {results.get('avg_accuracy', 0):.1f}%")
-    print(f"Time Pattern Consistency: {results.get('avg_time_consistency', 0):.1%}")
-    
-    print(f"\n[TIME] TIME ANALYSIS")
-    print("-"*80)
-    if results.get('avg_time_consistency', 0) > 0.5:
-        print("[OK] Natural time patterns - variable response times")
-    elif results.get('avg_time_consistency', 0) > 0.3:
-        print("[WARN] Moderately consistent - some regularity in time usage")
+    assessment = ASSESSMENT_LABELS[bisect.bisect_right(ASSESSMENT_BOUNDS, suspicion_score)]
+    
+    out.append(f"Assessment: {assessment}")
+    
+    out.append(f"\n[METRICS] DETAILED METRICS")
+    out.append(_SEP_DASH)
+    out.append(f"Average Engine Match Rate: {avg_engine_match:.1f}%")
+    out.append(f"Average Blunder Rate: {avg_blunder_rate:.1f}%")
+    out.append(f"Average Accuracy: {avg_accuracy:.1f}%")
+    out.append(f"Time Pattern Consistency: {avg_time_consistency:.1%}")
+    
+    out.append(f"\n[TIME] TIME ANALYSIS")
+    out.append(_SEP_DASH)
+    if avg_time_consistency > 0.5:
+        out.append("[OK] Natural time patterns - variable response times")
+    elif avg_time_consistency > 0.3:
+        out.append("[WARN] Moderately consistent - some regularity in time usage")
     else:
-        print("[ALERT] Suspicious consistency - too regular response times")
+        out.append("[ALERT] Suspicious consistency - too regular response times")
     
-    print(f"\n[TOP] TOP SUSPICIOUS GAMES (Sorted by Accuracy)")
-    print("-"*80)
+    out.append(f"\n[TOP] TOP SUSPICIOUS GAMES (Sorted by Accuracy)")
+    out.append(_SEP_DASH)
     
     analyses = results.get('game_analyses', [])
+    suspicious_count = 0  # Games scoring over 50, counted while keying
     if analyses:
-        # Sort by accuracy (highest to lowest) then by suspicion score
-        sorted_games = sorted(
-            analyses, 
-            key=lambda x: (
-                -x.get('accuracy', {}).get('overall_accuracy', 0),
-                -x.get('suspicion_score', 0)
-            )
-        )[:5]
+        # Top 5 by accuracy (highest to lowest) then by suspicion score; keys
+        # are built once, and the index keeps ties in game order without
+        # ever comparing the analyses themselves
+        keyed = []
+        for i, g in enumerate(analyses):
+            suspicion = g.suspicion_score
+            if suspicion > 50:
+                suspicious_count += 1
+            keyed.append((-g.accuracy.overall_accuracy, -suspicion, i))
+        sorted_games = [analyses[i] for _, _, i in heapq.nsmallest(5, keyed)]
         
         for i, game in enumerate(sorted_games, 1):
-            accuracy = game.get('accuracy', {}).get('overall_accuracy', 0)
-            engine_match = game.get('engine_pattern', {}).get('top_1_match_rate', 0)
-            suspicion = game.get('suspicion_score', 0)
-            opponent_elo = game.get('opponent_elo', 0)
-            move_count = game.get('move_count', 0)
-            time_control = game.get('time_control', '')
+            accuracy = game.accuracy.overall_accuracy
+            engine_match = game.engine_pattern.top_1_match_rate
+            suspicion = game.suspicion_score
+            opponent_elo = game.opponent_elo
+            move_count = game.move_count
+            time_control = game.time_control
             
             # Color code accuracy
-            if accuracy >= 85:
-                accuracy_flag = "🔴 SUSPICIOUS"
-            elif accuracy >= 75:
-                accuracy_flag = "🟠 HIGH"
-            elif accuracy >= 60:
-                accuracy_flag = "🟡 MODERATE"
-            else:
-                accuracy_flag = "🟢 NORMAL"
+            accuracy_flag = ACCURACY_FLAG_LABELS[bisect.bisect_right(ACCURACY_FLAG_BOUNDS, accuracy)]
             
-            print(f"\n{i}. Game {i}")
-            print(f"   Accuracy: {accuracy:.1f}% {accuracy_flag}")
-            print(f"   Suspicion Score: {suspicion:.1f}/100")
-            print(f"   Engine Match: {engine_match:.1f}%")
-            print(f"   Opponent: {opponent_elo} Elo | Moves: {move_count} | {time_control}")
+            out.append(f"\n{i}. Game {i}")
+            out.append(f"   Accuracy: {accuracy:.1f}% {accuracy_flag}")
+            out.append(f"   Suspicion Score: {suspicion:.1f}/100")
+            out.append(f"   Engine Match: {engine_match:.1f}%")
+            out.append(f"   Opponent: {opponent_elo} Elo | Moves: {move_count} | {time_control}")
             
             # Phase breakdown
-            opening_acc = game.get('accuracy', {}).get('opening_accuracy', 0)
-            middlegame_acc = game.get('accuracy', {}).get('middlegame_accuracy', 0)
-            endgame_acc = game.get('accuracy', {}).get('endgame_accuracy', 0)
+            opening_acc = game.accuracy.opening_accuracy
+            middlegame_acc = game.accuracy.middlegame_accuracy
+            endgame_acc = game.accuracy.endgame_accuracy
             
             if opening_acc > 0 or middlegame_acc > 0 or endgame_acc > 0:
-                print(f"   Phase Breakdown: Opening {opening_acc:.0f}% | Middlegame {middlegame_acc:.0f}% | Endgame {endgame_acc:.0f}%")
+                out.append(f"   Phase Breakdown: Opening {opening_acc:.0f}% | Middlegame {middlegame_acc:.0f}% | Endgame {endgame_acc:.0f}%")
     else:
-        print("\nNo games analyzed successfully. Check error messages above.")
+        out.append("\nNo games analyzed successfully. Check error messages above.")
     
     # Option to save suspicious games
-    print(f"\n[SAVE] SAVE ANALYSIS")
-    print("-"*80)
-    suspicious_count = len([g for g in analyses if g.get('suspicion_score', 0) > 50])
-    print(f"Suspicious Games Found: {suspicious_count}/{len(analyses)}")
-    print("To save these games, use the 'Export' option in the menu (PGN/CSV format)")
+    out.append(f"\n[SAVE] SAVE ANALYSIS")
+    out.append(_SEP_DASH)
+    out.append(f"Suspicious Games Found: {suspicious_count}/{games_analyzed}")
+    out.append("To save these games, use the 'Export' option in the menu (PGN/CSV format)")
+    
+    out.append("\n" + _SEP_EQ)
     
-    print("\n" + "="*80)
+    sys.stdout.write("\n".join(out) + "\n")
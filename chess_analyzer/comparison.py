@@ -4,23 +4,25 @@ Compare statistics across multiple players to identify patterns and anomalies.
 """
 
 from typing import List, Dict, Tuple
-from .account_metrics import analyze_account_behavior
+from .account_metrics import analyze_accounts_batch
 from .fetcher import fetch_player_games
 
 
 class PlayerComparison:
     """Compare multiple players' statistics and patterns."""
     
-    def __init__(self, usernames: List[str], max_games: int = 100):
+    def __init__(self, usernames: List[str], max_games: int = 100, workers: int = 1):
         """
         Initialize player comparison.
         
         Args:
             usernames: List of Chess.com usernames to compare
             max_games: Maximum games to fetch per player
+            workers: Processes used to analyze players (None = CPU count)
         """
         self.usernames = usernames
         self.max_games = max_games
+        self.workers = workers
         self.player_data = {}
         self.player_games = {}
     
@@ -37,13 +39,19 @@ class PlayerComparison:
                 games = fetch_player_games(username, max_games=self.max_games)
                 if games:
                     self.player_games[username] = games
-                    self.player_data[username] = analyze_account_behavior(games, username)
                 else:
                     print(f"    ⚠️  No games found for {username}")
             except Exception as e:
                 print(f"    ❌ Error fetching games for {username}: {e}")
                 return False
         
+        # Analyze every fetched player in one batch
+        try:
+            self.player_data.update(analyze_accounts_batch(self.player_games, workers=self.workers))
+        except Exception as e:
+            print(f"    ❌ Error analyzing players: {e}")
+            return False
+        
         return len(self.player_data) > 0
     
     def get_rating_comparison(self) -> Dict[str, Dict]:
@@ -3,11 +3,14 @@ Stockfish chess engine integration for game analysis.
 """
 import chess
 import chess.engine
+import chess.polyglot
 import logging
 import os
+import pickle
 import subprocess
 import platform
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 
 # Local imports
@@ -15,6 +18,9 @@ from .utils.helpers import find_stockfish_windows, test_stockfish_installation
 
 logger = logging.getLogger(__name__)
 
+# Default bound on cached position evaluations (least recently used are evicted)
+EVAL_CACHE_SIZE = 500_000
+
 @dataclass
 class EngineResult:
     """Container for engine analysis results."""
@@ -51,6 +57,14 @@ class StockfishManager:
         self.threads = self.config.get('analysis', {}).get('threads', 2)
         self.hash_size = self.config.get('analysis', {}).get('hash_size', 256)
         
+        # Evaluations keyed by Zobrist hash, shared across games so repeated
+        # openings and transpositions are only sent to the engine once
+        self.eval_cache_size = self.config.get('analysis', {}).get('eval_cache_size', EVAL_CACHE_SIZE)
+        self.eval_cache_file = self.config.get('analysis', {}).get('eval_cache_file', '')
+        self._eval_cache: "OrderedDict[int, Tuple[Optional[str], Optional[int]]]" = OrderedDict()
+        if self.eval_cache_file:
+            self._load_eval_cache()
+        
         self.engine = None
         logger.info(f"Stockfish manager initialized with: {self.engine_path}")
     
@@ -99,6 +113,92 @@ class StockfishManager:
             "2. Or set correct engine_path in config.yaml"
         )
     
+    def _eval_cache_id(self) -> str:
+        """Identify the settings cached evaluations are valid for."""
+        return f"{os.path.basename(self.engine_path)}:depth={self.engine_depth}"
+    
+    def _load_eval_cache(self) -> None:
+        """Load persisted evaluations if they were made with the same engine and depth."""
+        try:
+            with open(self.eval_cache_file, 'rb') as f:
+                cache_id, entries = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"Could not load evaluation cache: {e}")
+            return
+        
+        if cache_id == self._eval_cache_id():
+            self._eval_cache.update(entries)
+            logger.info(f"Loaded {len(self._eval_cache)} cached evaluations")
+    
+    def save_eval_cache(self) -> None:
+        """
+        Persist the evaluation cache to eval_cache_file (if configured).
+        
+        Entries saved by other processes since this one loaded the file
+        (e.g. the other process-pool workers) are merged in first, with
+        this process's evaluations kept as the most recent. The file is
+        replaced atomically; concurrent saves can lose each other's new
+        entries, which only costs later cache misses.
+        """
+        if not self.eval_cache_file:
+            return
+        try:
+            entries = self._eval_cache
+            try:
+                with open(self.eval_cache_file, 'rb') as f:
+                    cache_id, saved = pickle.load(f)
+            except Exception:
+                cache_id, saved = None, None
+            
+            if saved and cache_id == self._eval_cache_id():
+                saved = OrderedDict(saved)
+                for key, entry in entries.items():
+                    saved[key] = entry
+                    saved.move_to_end(key)
+                while len(saved) > self.eval_cache_size:
+                    saved.popitem(last=False)
+                entries = saved
+            
+            temp_file = f"{self.eval_cache_file}.{os.getpid()}.tmp"
+            with open(temp_file, 'wb') as f:
+                pickle.dump((self._eval_cache_id(), entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, self.eval_cache_file)
+        except Exception as e:
+            logger.warning(f"Could not save evaluation cache: {e}")
+    
+    def _evaluate(self, engine_getter, board: chess.Board) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Evaluate a position, consulting the Zobrist-keyed cache first.
+        
+        Args:
+            engine_getter: Callable returning the running engine (only
+                called on a cache miss)
+            board: Position to evaluate
+        
+        Returns:
+            (best move in UCI or None, White-relative score in centipawns or None)
+        """
+        key = chess.polyglot.zobrist_hash(board)
+        cache = self._eval_cache
+        entry = cache.get(key)
+        if entry is not None:
+            cache.move_to_end(key)
+            return entry
+        
+        analysis = engine_getter().analyse(board, chess.engine.Limit(depth=self.engine_depth))
+        pv_list = analysis.get('pv', [])
+        entry = (
+            pv_list[0].uci() if pv_list else None,
+            analysis['score'].white().score(mate_score=10000) if 'score' in analysis else None
+        )
+        
+        cache[key] = entry
+        if len(cache) > self.eval_cache_size:
+            cache.popitem(last=False)
+        return entry
+    
     def _verify_engine(self) -> None:
         """Verify Stockfish installation - LENIENT VERSION."""
         logger.info("Verifying Stockfish...")
@@ -234,28 +334,32 @@ class StockfishManager:
         
         move_count = 0
         
+        engine = None
+        
+        def get_engine():
+            # Start a fresh engine for this game, only once a position misses the cache
+            nonlocal engine
+            if engine is None:
+                engine = self.start_engine()
+            return engine
+        
         try:
-            # Start fresh engine for this game
-            engine = self.start_engine()
-            
             # Go through each move
             for move in game.mainline_moves():
                 move_count += 1
                 
                 # Analyze current position
-                analysis = engine.analyse(board, chess.engine.Limit(depth=self.engine_depth))
+                best_move, score_cp = self._evaluate(get_engine, board)
                 
                 # Check if player's move matches engine's best move
-                pv_list = analysis.get('pv', [])
-                best_move = pv_list[0] if pv_list else None
-                player_moved_best = (best_move == move) if best_move else False
+                player_moved_best = (best_move == move.uci()) if best_move else False
                 
                 position_data = {
                     'move_number': move_count,
                     'move': str(move),
                     'fen': board.fen(),
-                    'best_move': str(best_move) if best_move else None,
-                    'score_cp': analysis['score'].white().score(mate_score=10000) if 'score' in analysis else None,
+                    'best_move': best_move,
+                    'score_cp': score_cp,
                     'player_moved_best': player_moved_best
                 }
                 
@@ -279,7 +383,8 @@ class StockfishManager:
             
             # Close engine
             try:
-                engine.quit()
+                if engine is not None:
+                    engine.quit()
             except:
                 pass
             
@@ -291,7 +396,7 @@ class StockfishManager:
             
             # Try to close engine
             try:
-                if 'engine' in locals():
+                if engine is not None:
                     engine.quit()
             except:
                 pass
@@ -301,6 +406,7 @@ class StockfishManager:
     def cleanup(self) -> None:
         """Clean up engine instances."""
         logger.info("Cleaning up Stockfish engine...")
+        self.save_eval_cache()
         
         if self.engine:
             try:
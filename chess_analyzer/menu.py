@@ -210,6 +210,14 @@ def main():
             print("\nInvalid option!")
 
 
+def _v3_json_default(obj):
+    """json.dump default for v3 results: GameAnalysisV3 entries become dicts."""
+    from .analyzer_v3 import GameAnalysisV3
+    if isinstance(obj, GameAnalysisV3):
+        return obj.asdict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def _analyze_player():
     print("\n" + "-"*50)
     print("[ANALYZE] ANALYZE PLAYER (Enhanced v3.0 - Dual Platform)")
@@ -394,7 +402,7 @@ def _analyze_player():
             if fmt == "json":
                 filename = export_dir / f"analysis_{username}_{timestamp}.json"
                 with open(filename, 'w') as f:
-                    json.dump(results, f, indent=2)
+                    json.dump(results, f, indent=2, default=_v3_json_default)
                 print(f"✓ Saved to {filename.name}")
             else:
                 filename = export_dir / f"analysis_{username}_{timestamp}.txt"
@@ -1005,12 +1013,12 @@ def _accuracy_report():
             if not game_analysis:
                 continue
             
-            game = game_analysis.game
-            white = game.headers.get("White", "").lower()
-            black = game.headers.get("Black", "").lower()
-            result = game.headers.get("Result", "*")
-            opponent_elo = game.headers.get("BlackElo" if white == username.lower() else "WhiteElo", "?")
-            move_count = len(list(game.mainline_moves()))
+            headers = game_analysis.headers
+            white = headers.get("White", "").lower()
+            black = headers.get("Black", "").lower()
+            result = headers.get("Result", "*")
+            opponent_elo = headers.get("BlackElo" if white == username.lower() else "WhiteElo", "?")
+            move_count = game_analysis.metadata.get('move_count', 0)
             
             # Get accuracy from analysis
             accuracy = game_analysis.accuracy_score
@@ -2314,11 +2322,14 @@ def _export_suspicious_games(results, username, all_games):
         export_dir = Path("exports")
         export_dir.mkdir(exist_ok=True)
         
-        # Collect suspicious games
+        # Collect suspicious games (analyses keep only a game_id, so look
+        # each one up among the games that were analyzed)
+        from .analyzer import game_id_for
+        games_by_id = {game_id_for(game): game for game in all_games}
         suspicious_games = []
         for game_analysis in results.game_analyses:
-            if game_analysis.is_suspicious:
-                suspicious_games.append(game_analysis.game)
+            if game_analysis.is_suspicious and game_analysis.game_id in games_by_id:
+                suspicious_games.append(games_by_id[game_analysis.game_id])
         
         if not suspicious_games:
             print("No suspicious games to export.")
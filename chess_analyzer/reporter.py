@@ -10,7 +10,7 @@ from typing import Dict, List, Any, Optional
 import jinja2
 
 # Local imports
-from .utils.helpers import create_directory
+from .utils.helpers import create_directory, json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -635,8 +635,8 @@ class ReportGenerator:
             JSON report as string
         """
         try:
-            # Pretty print JSON
-            json_output = json.dumps(analysis_data, indent=2, default=str)
+            # Pretty print JSON (orjson when installed)
+            json_output = json_dumps(analysis_data, indent=True)
             logger.info("Generated JSON report")
             return json_output
         except Exception as e:
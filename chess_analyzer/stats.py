@@ -6,6 +6,79 @@ import math
 from typing import List, Dict, Tuple, Optional
 import numpy as np
 
+from .utils.helpers import NUMBA_AVAILABLE, njit
+
+# Rating kernels. The loop versions take int32 rating arrays and are the
+# single source for both numba.njit and the ahead-of-time build in
+# stats_aot_build.py; the NumPy versions are used when numba is missing.
+
+def _progression_loop(ratings):
+    """Return (avg_change, max_abs_change) of consecutive ratings."""
+    total = 0.0
+    max_change = 0.0
+    for i in range(1, ratings.shape[0]):
+        change = float(ratings[i] - ratings[i - 1])
+        total += change
+        if abs(change) > max_change:
+            max_change = abs(change)
+    return total / (ratings.shape[0] - 1), max_change
+
+def _volatility_loop(ratings):
+    """Return (mean, stdev, first_half_mean, second_half_mean) in one Welford pass."""
+    n = ratings.shape[0]
+    mid = n // 2
+    mean = 0.0
+    m2 = 0.0
+    total = 0.0
+    first_total = 0.0
+    for i in range(n):
+        x = float(ratings[i])
+        delta = x - mean
+        mean += delta / (i + 1)
+        m2 += delta * (x - mean)
+        total += x
+        if i < mid:
+            first_total += x
+    return mean, math.sqrt(m2 / (n - 1)), first_total / mid, (total - first_total) / (n - mid)
+
+def _anomaly_loop(player_ratings, opponent_ratings):
+    """Return the mean opponent-minus-player rating difference."""
+    total = 0.0
+    for i in range(player_ratings.shape[0]):
+        total += float(opponent_ratings[i] - player_ratings[i])
+    return total / player_ratings.shape[0]
+
+def _progression_numpy(ratings):
+    changes = np.diff(ratings.astype(np.int64))
+    return float(changes.mean()), float(np.abs(changes).max())
+
+def _volatility_numpy(ratings):
+    ratings = ratings.astype(np.float64)
+    mid = len(ratings) // 2
+    return (float(ratings.mean()), float(ratings.std(ddof=1)),
+            float(ratings[:mid].mean()), float(ratings[mid:].mean()))
+
+def _anomaly_numpy(player_ratings, opponent_ratings):
+    return float((opponent_ratings.astype(np.int64) - player_ratings.astype(np.int64)).mean())
+
+try:
+    # Shared library produced by ``python -m chess_analyzer.stats_aot_build``
+    from .stats_aot import (
+        progression as _progression_kernel,
+        volatility as _volatility_kernel,
+        anomaly as _anomaly_kernel,
+    )
+except ImportError:
+    if NUMBA_AVAILABLE:
+        _jit = njit(cache=True, nogil=True, fastmath=True)
+        _progression_kernel = _jit(_progression_loop)
+        _volatility_kernel = _jit(_volatility_loop)
+        _anomaly_kernel = _jit(_anomaly_loop)
+    else:
+        _progression_kernel = _progression_numpy
+        _volatility_kernel = _volatility_numpy
+        _anomaly_kernel = _anomaly_numpy
+
 def calculate_confidence_interval(data: List[float], confidence: float = 0.95) -> Tuple[float, float, float]:
     """
     Calculate confidence interval for data.
@@ -119,6 +192,55 @@ def calculate_consistency_score(accuracies: List[float]) -> float:
     
     return consistency
 
+class MoveTimePatternAccumulator:
+    """
+    Streaming form of calculate_move_time_patterns.
+
+    Keeps a Welford running mean/variance and a count per 0.1s bucket, so
+    memory grows with the number of distinct buckets rather than samples.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.time_groups = {}
+
+    def update(self, time: float) -> None:
+        """Add a single move time sample."""
+        self.count += 1
+        delta = time - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (time - self.mean)
+
+        rounded = round(time, 1)  # Group by 0.1s precision
+        self.time_groups[rounded] = self.time_groups.get(rounded, 0) + 1
+
+    def finalize(self) -> Dict[str, float]:
+        """Return the pattern statistics for all samples seen so far."""
+        if not self.count:
+            return {}
+
+        mean_time = self.mean
+        stdev_time = math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0
+
+        # Check for suspicious patterns
+        cv = (stdev_time / mean_time * 100) if mean_time > 0 else 0  # Coefficient of variation
+
+        # Count moves with very similar times
+        most_common_time = max(self.time_groups.items(), key=lambda x: x[1])
+        common_time_percentage = most_common_time[1] / self.count * 100
+
+        return {
+            'mean_time': mean_time,
+            'stdev_time': stdev_time,
+            'coefficient_variation': cv,
+            'most_common_time': most_common_time[0],
+            'common_time_percentage': common_time_percentage,
+            'is_suspicious': common_time_percentage > 30 and cv < 20  # Too consistent
+        }
+
+
 def calculate_move_time_patterns(move_times: List[float]) -> Dict[str, float]:
     """
     Analyze move time patterns for suspicious consistency.
@@ -129,40 +251,17 @@ def calculate_move_time_patterns(move_times: List[float]) -> Dict[str, float]:
     Returns:
         Dictionary of pattern statistics
     """
-    if not move_times:
-        return {}
-    
-    # Calculate various statistics
-    mean_time = statistics.mean(move_times)
-    stdev_time = statistics.stdev(move_times) if len(move_times) > 1 else 0
-    
-    # Check for suspicious patterns
-    cv = (stdev_time / mean_time * 100) if mean_time > 0 else 0  # Coefficient of variation
-    
-    # Count moves with very similar times
-    time_groups = {}
+    acc = MoveTimePatternAccumulator()
     for time in move_times:
-        rounded = round(time, 1)  # Group by 0.1s precision
-        time_groups[rounded] = time_groups.get(rounded, 0) + 1
-    
-    most_common_time = max(time_groups.items(), key=lambda x: x[1]) if time_groups else (0, 0)
-    common_time_percentage = (most_common_time[1] / len(move_times) * 100) if move_times else 0
-    
-    return {
-        'mean_time': mean_time,
-        'stdev_time': stdev_time,
-        'coefficient_variation': cv,
-        'most_common_time': most_common_time[0],
-        'common_time_percentage': common_time_percentage,
-        'is_suspicious': common_time_percentage > 30 and cv < 20  # Too consistent
-    }
+        acc.update(time)
+    return acc.finalize()
 
 def calculate_rating_progression(ratings: List[int]) -> Dict[str, float]:
     """
     Analyze rating progression for suspicious jumps.
     
     Args:
-        ratings: List of ratings over time
+        ratings: List or integer array of ratings over time
     
     Returns:
         Dictionary of progression statistics
@@ -170,12 +269,9 @@ def calculate_rating_progression(ratings: List[int]) -> Dict[str, float]:
     if len(ratings) < 2:
         return {'avg_change': 0, 'max_change': 0, 'suspicious': False}
     
-    changes = []
-    for i in range(1, len(ratings)):
-        changes.append(ratings[i] - ratings[i - 1])
-    
-    avg_change = statistics.mean(changes)
-    max_change = max(abs(c) for c in changes) if changes else 0
+    ratings = np.ascontiguousarray(ratings, dtype=np.int32)
+    avg_change, max_change = _progression_kernel(ratings)
+    avg_change, max_change = float(avg_change), int(max_change)
     
     # Check for suspicious rating jumps
     suspicious = max_change > 200  # More than 200 point jump is suspicious
@@ -184,7 +280,7 @@ def calculate_rating_progression(ratings: List[int]) -> Dict[str, float]:
         'avg_change': avg_change,
         'max_change': max_change,
         'suspicious': suspicious,
-        'changes': changes
+        'changes': np.diff(ratings).tolist()
     }
 
 def calculate_accuracy_anomaly(recent_accuracy: float, historical_average: float) -> float:
@@ -207,34 +303,63 @@ def calculate_accuracy_anomaly(recent_accuracy: float, historical_average: float
     anomaly = min(100, abs(diff) * 2)  # Max 50% difference
     return anomaly
 
-def detect_game_clustering(game_dates: List[str]) -> Dict[str, float]:
+def parse_pgn_dates(game_dates: List[str]) -> np.ndarray:
     """
-    ENHANCED: Detect suspicious clustering of games (all played in short time period).
+    Convert PGN date strings ("YYYY.MM.DD") to day numbers in one vectorized parse.
     
     Args:
         game_dates: List of game date strings
     
+    Returns:
+        int64 array of days since the Unix epoch; placeholder or partial
+        dates such as "????.??.??" are dropped
+    """
+    normalized = [date[:10].replace('.', '-') for date in game_dates]
+    try:
+        days = np.array(normalized, dtype='datetime64[D]')
+    except ValueError:
+        # At least one unparseable date - fall back to filtering element-wise
+        parsed = []
+        for date in normalized:
+            try:
+                parsed.append(np.datetime64(date, 'D'))
+            except ValueError:
+                pass
+        days = np.array(parsed, dtype='datetime64[D]')
+    return days[~np.isnat(days)].view('i8')
+
+def detect_game_clustering(game_dates) -> Dict[str, float]:
+    """
+    ENHANCED: Detect suspicious clustering of games (all played in short time period).
+    
+    Args:
+        game_dates: List of game date strings, or an array of day numbers
+            as returned by parse_pgn_dates
+    
     Returns:
         Dictionary with clustering metrics
     """
-    if len(game_dates) < 2:
+    days = np.asarray(game_dates)
+    if days.dtype.kind in 'US':
+        days = parse_pgn_dates(game_dates)
+    elif days.dtype.kind == 'M':
+        days = days.astype('datetime64[D]').view('i8')
+    
+    if len(days) < 2:
         return {'is_clustered': False, 'clustering_score': 0.0}
     
-    # Count games per day (approximate)
-    day_counts = {}
-    for date in game_dates:
-        day = date[:10] if len(date) >= 10 else date  # Get YYYY-MM-DD
-        day_counts[day] = day_counts.get(day, 0) + 1
+    # Count games per day
+    _, day_counts = np.unique(days, return_counts=True)
     
     # Check if too many games in one day (suspicious for blitz)
-    max_games_per_day = max(day_counts.values()) if day_counts else 0
+    max_games_per_day = int(day_counts.max())
     clustering_score = min(100, (max_games_per_day - 5) * 10) if max_games_per_day > 5 else 0
     
     return {
         'is_clustered': max_games_per_day > 10,
         'clustering_score': clustering_score,
         'max_games_per_day': max_games_per_day,
-        'days_played': len(day_counts)
+        'days_played': int(len(day_counts))
     }
 
 def calculate_opponent_strength_anomaly(player_ratings: List[int], opponent_ratings: List[int]) -> float:
@@ -242,17 +367,19 @@ def calculate_opponent_strength_anomaly(player_ratings: List[int], opponent_rati
     ENHANCED: Detect if player is consistently beating much stronger opponents (or weaker).
     
     Args:
-        player_ratings: List of player ratings per game
-        opponent_ratings: List of opponent ratings per game
+        player_ratings: List or integer array of player ratings per game
+        opponent_ratings: List or integer array of opponent ratings per game
     
     Returns:
         Anomaly score (higher = more suspicious)
     """
-    if len(player_ratings) != len(opponent_ratings) or not player_ratings:
+    if len(player_ratings) != len(opponent_ratings) or len(player_ratings) == 0:
         return 0.0
     
-    rating_differences = [opp - player for player, opp in zip(player_ratings, opponent_ratings)]
-    avg_diff = statistics.mean(rating_differences)
+    avg_diff = float(_anomaly_kernel(
+        np.ascontiguousarray(player_ratings, dtype=np.int32),
+        np.ascontiguousarray(opponent_ratings, dtype=np.int32),
+    ))
     
     # Positive means player is beating stronger opponents
     # More than +100 average is suspicious
@@ -265,7 +392,7 @@ def calculate_rating_volatility(ratings: List[int]) -> Dict[str, float]:
     Analyze rating volatility and stability.
     
     Args:
-        ratings: List of ratings over time (in order)
+        ratings: List or integer array of ratings over time (in order)
     
     Returns:
         Dictionary with volatility metrics
@@ -279,14 +406,12 @@ def calculate_rating_volatility(ratings: List[int]) -> Dict[str, float]:
             'trend_direction': 'neutral'
         }
     
-    stdev = statistics.stdev(ratings)
-    mean_rating = statistics.mean(ratings)
+    mean_rating, stdev, first_half_mean, second_half_mean = (
+        float(v) for v in _volatility_kernel(np.ascontiguousarray(ratings, dtype=np.int32))
+    )
     cv = (stdev / mean_rating * 100) if mean_rating > 0 else 0  # Coefficient of variation
     
     # Check trend: compare first half to second half
-    mid = len(ratings) // 2
-    first_half_mean = statistics.mean(ratings[:mid])
-    second_half_mean = statistics.mean(ratings[mid:])
     trend_diff = second_half_mean - first_half_mean
     
     if abs(trend_diff) < 20:
@@ -315,40 +440,41 @@ def calculate_rating_volatility(ratings: List[int]) -> Dict[str, float]:
         'trend_value': trend_diff
     }
 
-def analyze_time_management(games) -> Dict[str, any]:
+class TimeManagementAccumulator:
     """
-    Analyze time management and time control distribution.
-    
-    Args:
-        games: List of chess game objects
-    
-    Returns:
-        Dictionary with time management metrics
+    Incremental time management tally, fed one game's headers at a time.
+
+    Lets callers that already loop over games collect these metrics in the
+    same pass instead of walking the game list again.
     """
-    time_controls = {}
-    time_control_results = {}
-    avg_time_per_move = {}
-    
-    for game in games:
-        headers = game.headers
+
+    def __init__(self):
+        self.time_controls = {}
+        self.time_control_results = {}
+        self.avg_time_per_move = {}
+        self.game_count = 0
+
+    def update(self, headers) -> None:
+        """Add a single game's headers to the tally."""
+        self.game_count += 1
         time_control = headers.get('TimeControl', 'Unknown')
         result = headers.get('Result', '*')
-        
-        if time_control not in time_controls:
-            time_controls[time_control] = 0
-            time_control_results[time_control] = {'wins': 0, 'draws': 0, 'losses': 0}
-            avg_time_per_move[time_control] = []
-        
-        time_controls[time_control] += 1
-        
+
+        if time_control not in self.time_controls:
+            self.time_controls[time_control] = 0
+            self.time_control_results[time_control] = {'wins': 0, 'draws': 0, 'losses': 0}
+            self.avg_time_per_move[time_control] = []
+
+        self.time_controls[time_control] += 1
+
         # Track results by time control
         if result == '1-0':
-            time_control_results[time_control]['wins'] += 1
+            self.time_control_results[time_control]['wins'] += 1
         elif result == '0-1':
-            time_control_results[time_control]['losses'] += 1
+            self.time_control_results[time_control]['losses'] += 1
         else:
-            time_control_results[time_control]['draws'] += 1
-        
+            self.time_control_results[time_control]['draws'] += 1
+
         # Estimate time per move from time control
         try:
             # Parse time control format: "minutes+increment" or "minutes"
@@ -356,78 +482,81 @@ def analyze_time_management(games) -> Dict[str, any]:
             if len(tc_parts) >= 1:
                 base_time = int(tc_parts[0])
                 increment = int(tc_parts[1]) if len(tc_parts) > 1 else 0
-                
+
                 # Estimate avg time per move
                 moves_estimate = 40  # Average game length
                 estimated_time_per_move = (base_time / moves_estimate) + increment
-                avg_time_per_move[time_control].append(estimated_time_per_move)
+                self.avg_time_per_move[time_control].append(estimated_time_per_move)
         except:
             pass
-    
-    # Calculate time management metrics
-    total_games = len(games) if games else 1
-    num_time_controls = len(time_controls)
-    
-    # Find primary time control
-    primary_tc = max(time_controls.items(), key=lambda x: x[1]) if time_controls else ('Unknown', 0)
-    primary_tc_percentage = (primary_tc[1] / total_games * 100) if total_games > 0 else 0
-    
-    # Time control diversity
-    if num_time_controls > 3:
-        time_control_type = 'very_diverse'
-    elif num_time_controls > 2:
-        time_control_type = 'diverse'
-    elif num_time_controls > 1:
-        time_control_type = 'mixed'
-    else:
-        time_control_type = 'focused'
-    
-    # Calculate win rates by time control
-    time_control_performance = {}
-    for tc, results in time_control_results.items():
-        total = results['wins'] + results['draws'] + results['losses']
-        if total > 0:
-            win_rate = (results['wins'] / total * 100)
-            draw_rate = (results['draws'] / total * 100)
-            loss_rate = (results['losses'] / total * 100)
-            
-            time_control_performance[tc] = {
-                'win_rate': win_rate,
-                'draw_rate': draw_rate,
-                'loss_rate': loss_rate,
-                'games': total
-            }
-    
-    return {
-        'time_control_distribution': time_controls,
-        'primary_time_control': primary_tc[0],
-        'primary_tc_percentage': primary_tc_percentage,
-        'time_control_variety': time_control_type,
-        'num_time_controls': num_time_controls,
-        'time_control_performance': time_control_performance
-    }
 
-def analyze_opening_variety(games) -> Dict[str, any]:
+    def finalize(self) -> Dict[str, any]:
+        """Return the time management metrics for all games seen so far."""
+        time_controls = self.time_controls
+
+        # Calculate time management metrics
+        total_games = self.game_count if self.game_count else 1
+        num_time_controls = len(time_controls)
+
+        # Find primary time control
+        primary_tc = max(time_controls.items(), key=lambda x: x[1]) if time_controls else ('Unknown', 0)
+        primary_tc_percentage = (primary_tc[1] / total_games * 100) if total_games > 0 else 0
+
+        # Time control diversity
+        if num_time_controls > 3:
+            time_control_type = 'very_diverse'
+        elif num_time_controls > 2:
+            time_control_type = 'diverse'
+        elif num_time_controls > 1:
+            time_control_type = 'mixed'
+        else:
+            time_control_type = 'focused'
+
+        # Calculate win rates by time control
+        time_control_performance = {}
+        for tc, results in self.time_control_results.items():
+            total = results['wins'] + results['draws'] + results['losses']
+            if total > 0:
+                win_rate = (results['wins'] / total * 100)
+                draw_rate = (results['draws'] / total * 100)
+                loss_rate = (results['losses'] / total * 100)
+
+                time_control_performance[tc] = {
+                    'win_rate': win_rate,
+                    'draw_rate': draw_rate,
+                    'loss_rate': loss_rate,
+                    'games': total
+                }
+
+        return {
+            'time_control_distribution': time_controls,
+            'primary_time_control': primary_tc[0],
+            'primary_tc_percentage': primary_tc_percentage,
+            'time_control_variety': time_control_type,
+            'num_time_controls': num_time_controls,
+            'time_control_performance': time_control_performance
+        }
+
+
+class OpeningVarietyAccumulator:
     """
-    Analyze opening variety and repertoire.
-    
-    Args:
-        games: List of chess game objects
-    
-    Returns:
-        Dictionary with opening diversity metrics
+    Incremental opening repertoire tally, fed one game's headers at a time.
     """
-    openings = {}  # Format: "ECO - Opening Name"
-    eco_codes = {}
-    time_controls = {}
-    results_by_opening = {}
-    
-    for game in games:
-        headers = game.headers
+
+    def __init__(self):
+        self.openings = {}  # Format: "ECO - Opening Name"
+        self.eco_codes = {}
+        self.time_controls = {}
+        self.results_by_opening = {}
+        self.game_count = 0
+
+    def update(self, headers) -> None:
+        """Add a single game's headers to the tally."""
+        self.game_count += 1
         eco = headers.get('ECO', 'Unknown')
         opening = headers.get('Opening', 'Unknown')
         time_control = headers.get('TimeControl', 'Unknown')
-        
+
         # Create opening key combining ECO and name
         if eco != 'Unknown' and opening != 'Unknown':
             opening_key = f"{eco} - {opening}"
@@ -435,66 +564,99 @@ def analyze_opening_variety(games) -> Dict[str, any]:
             opening_key = eco
         else:
             opening_key = opening
-        
+
         # Track opening frequency
-        if opening_key not in openings:
-            openings[opening_key] = 0
-            eco_codes[opening_key] = eco
-            results_by_opening[opening_key] = {'wins': 0, 'draws': 0, 'losses': 0}
-        openings[opening_key] += 1
-        
+        if opening_key not in self.openings:
+            self.openings[opening_key] = 0
+            self.eco_codes[opening_key] = eco
+            self.results_by_opening[opening_key] = {'wins': 0, 'draws': 0, 'losses': 0}
+        self.openings[opening_key] += 1
+
         # Track time control
-        time_controls[time_control] = time_controls.get(time_control, 0) + 1
-        
+        self.time_controls[time_control] = self.time_controls.get(time_control, 0) + 1
+
         # Track results
         result = headers.get('Result', '*')
-        white = headers.get('White', '').lower()
-        black = headers.get('Black', '').lower()
-        
+
         # Determine if player is white or black (use first game to infer)
         # This is a simplification - ideally we'd have username
         is_white = True  # Default assumption
-        
+
         if result == '1-0':
             winner = 'white'
         elif result == '0-1':
             winner = 'black'
         else:
             winner = 'draw'
-        
+
         if winner == 'draw':
-            results_by_opening[opening_key]['draws'] += 1
+            self.results_by_opening[opening_key]['draws'] += 1
         elif (winner == 'white' and is_white) or (winner == 'black' and not is_white):
-            results_by_opening[opening_key]['wins'] += 1
+            self.results_by_opening[opening_key]['wins'] += 1
         else:
-            results_by_opening[opening_key]['losses'] += 1
-    
-    # Calculate diversity metrics
-    num_openings = len(openings)
-    total_games = len(games) if games else 1
-    opening_diversity = (num_openings / total_games * 100) if total_games > 0 else 0
-    
-    # Find most played opening
-    most_played = max(openings.items(), key=lambda x: x[1]) if openings else ('None', 0)
-    most_played_percentage = (most_played[1] / total_games * 100) if total_games > 0 else 0
-    
-    # Opening concentration (are they playing a limited repertoire?)
-    if opening_diversity > 50:
-        repertoire_type = 'very_diverse'
-    elif opening_diversity > 30:
-        repertoire_type = 'diverse'
-    elif opening_diversity > 15:
-        repertoire_type = 'moderate'
-    else:
-        repertoire_type = 'limited'
+            self.results_by_opening[opening_key]['losses'] += 1
+
+    def finalize(self) -> Dict[str, any]:
+        """Return the opening diversity metrics for all games seen so far."""
+        openings = self.openings
+
+        # Calculate diversity metrics
+        num_openings = len(openings)
+        total_games = self.game_count if self.game_count else 1
+        opening_diversity = (num_openings / total_games * 100) if total_games > 0 else 0
+
+        # Find most played opening
+        most_played = max(openings.items(), key=lambda x: x[1]) if openings else ('None', 0)
+        most_played_percentage = (most_played[1] / total_games * 100) if total_games > 0 else 0
+
+        # Opening concentration (are they playing a limited repertoire?)
+        if opening_diversity > 50:
+            repertoire_type = 'very_diverse'
+        elif opening_diversity > 30:
+            repertoire_type = 'diverse'
+        elif opening_diversity > 15:
+            repertoire_type = 'moderate'
+        else:
+            repertoire_type = 'limited'
+
+        return {
+            'num_openings': num_openings,
+            'opening_diversity_percent': opening_diversity,
+            'most_played_opening': most_played[0],
+            'most_played_count': most_played[1],
+            'most_played_percentage': most_played_percentage,
+            'repertoire_type': repertoire_type,
+            'time_control_distribution': self.time_controls,
+            'opening_stats': self.results_by_opening
+        }
+
+
+def analyze_time_management(games) -> Dict[str, any]:
+    """
+    Analyze time management and time control distribution.
     
-    return {
-        'num_openings': num_openings,
-        'opening_diversity_percent': opening_diversity,
-        'most_played_opening': most_played[0],
-        'most_played_count': most_played[1],
-        'most_played_percentage': most_played_percentage,
-        'repertoire_type': repertoire_type,
-        'time_control_distribution': time_controls,
-        'opening_stats': results_by_opening
-    }
\ No newline at end of file
+    Args:
+        games: List of chess game objects
+    
+    Returns:
+        Dictionary with time management metrics
+    """
+    acc = TimeManagementAccumulator()
+    for game in games:
+        acc.update(game.headers)
+    return acc.finalize()
+
+def analyze_opening_variety(games) -> Dict[str, any]:
+    """
+    Analyze opening variety and repertoire.
+    
+    Args:
+        games: List of chess game objects
+    
+    Returns:
+        Dictionary with opening diversity metrics
+    """
+    acc = OpeningVarietyAccumulator()
+    for game in games:
+        acc.update(game.headers)
+    return acc.finalize()
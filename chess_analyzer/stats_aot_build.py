@@ -0,0 +1,26 @@
+"""
+Ahead-of-time build of the rating statistics kernels.
+
+Compiles the loop kernels from stats.py into a ``stats_aot`` extension
+module next to this file, so installs that ship it skip numba JIT
+compilation (and need no numba at runtime). stats.py imports it when
+present and otherwise falls back to numba.njit or NumPy.
+
+Usage (requires numba at build time):
+    python -m chess_analyzer.stats_aot_build
+"""
+import os
+
+from numba.pycc import CC
+
+from .stats import _anomaly_loop, _progression_loop, _volatility_loop
+
+cc = CC('stats_aot')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export('progression', 'UniTuple(f8, 2)(i4[::1])')(_progression_loop)
+cc.export('volatility', 'UniTuple(f8, 4)(i4[::1])')(_volatility_loop)
+cc.export('anomaly', 'f8(i4[::1], i4[::1])')(_anomaly_loop)
+
+if __name__ == "__main__":
+    cc.compile()
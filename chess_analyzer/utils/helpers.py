@@ -3,6 +3,7 @@ Utility functions for Chess Fairplay Analyzer.
 """
 import os
 import sys
+import json
 import time
 import logging
 import subprocess
@@ -12,6 +13,60 @@ from pathlib import Path
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters get regular
+# __dict__-backed dataclasses.
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Numba is optional: numeric kernels decorated with njit run as plain
+# Python/NumPy when it is not installed.
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# orjson is optional: JSON reports fall back to the standard library encoder.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def json_dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize obj to JSON text, using orjson when it is installed.
+    
+    Args:
+        obj: Object to serialize; values JSON cannot represent are written
+            via str()
+        indent: Pretty-print with two-space indentation
+    
+    Returns:
+        JSON string
+    
+    Datetimes and dataclasses are passed through to str() on both paths, so
+    they match the json module's output. Two differences remain with orjson:
+    NaN/Infinity are written as null rather than NaN, and numpy arrays are
+    written as lists rather than their str().
+    """
+    if ORJSON_AVAILABLE:
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None, default=str)
+
 def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
     """Configure logging for the application."""
     log_level = getattr(logging, level.upper(), logging.INFO)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""
+Offline checks for account-level behavioral metrics (no network, no engine)
+"""
+import sys
+import io
+sys.path.insert(0, '.')
+
+import chess.pgn
+from chess_analyzer.account_metrics import analyze_account_behavior
+
+PGNS = [
+    """[Event "Live Blitz"]
+[Date "2025.01.20"]
+[White "Hikaru"]
+[Black "opponent"]
+[WhiteElo "2800"]
+[BlackElo "2600"]
+[Result "1-0"]
+[TimeControl "180+2"]
+[ECO "C50"]
+[Opening "Italian Game"]
+
+1. e4 e5 2. Nf3 Nc6 3. Bc4 Bc5 4. d3 Nf6 1-0""",
+    """[Event "Live Blitz"]
+[Date "2025.01.20"]
+[White "opponent"]
+[Black "hikaru"]
+[WhiteElo "2610"]
+[BlackElo "2805"]
+[Result "0-1"]
+[TimeControl "180+2"]
+[ECO "C50"]
+[Opening "Italian Game"]
+
+1. e4 e5 2. Nf3 Nc6 (2... Nf6 3. Nc3) 3. Bc4 Bc5 0-1""",
+    """[Event "Live Blitz"]
+[Date "2025.01.21"]
+[White "hikaru"]
+[Black "someone"]
+[WhiteElo "2790"]
+[BlackElo "?"]
+[Result "1/2-1/2"]
+[TimeControl "60"]
+
+1. d4 d5 2. c4 1/2-1/2""",
+    """[Event "Not his game"]
+[Date "2025.01.22"]
+[White "alice"]
+[Black "bob"]
+[WhiteElo "1500"]
+[BlackElo "1500"]
+[Result "1-0"]
+
+1. e4 1-0""",
+]
+
+games = [chess.pgn.read_game(io.StringIO(pgn)) for pgn in PGNS]
+
+print("TEST 1: list input")
+from_list = analyze_account_behavior(games, "Hikaru")
+assert from_list["time_management"]["time_control_distribution"] == {"180+2": 2, "60": 1}
+assert from_list["rating_progression"]["changes"] == [5]
+assert from_list["game_clustering"]["days_played"] == 2
+print("✓ Non-participant game skipped, unrated opponent ignored")
+
+print("TEST 2: generator input")
+from_generator = analyze_account_behavior((game for game in games), "Hikaru")
+assert from_generator == from_list
+print("✓ Generator consumed once with identical results")
+
+print("TEST 3: PGN text input")
+from_text = analyze_account_behavior(PGNS, "Hikaru")
+assert from_text == from_list
+print("✓ PGN strings match parsed games (variations not counted)")
+
+print("TEST 4: unrated opponent")
+# The "?" opponent game must add neither rating, so the player and opponent
+# series stay the same length and the anomaly score is still computed
+rated_only = analyze_account_behavior([games[0], games[1], games[3]], "Hikaru")
+assert from_list["rating_progression"] == rated_only["rating_progression"]
+assert from_list["rating_volatility"] == rated_only["rating_volatility"]
+assert from_list["opponent_strength_anomaly"] == rated_only["opponent_strength_anomaly"] > 0
+print("✓ Unrated-opponent game contributes no ratings")
+
+print("\nAll account metrics checks passed!")
@@ -79,14 +79,9 @@ try:
     if game_analyses:
         game = game_analyses[0]
         print(f"\n  Game analysis details:")
-        print(f"    Type of 'accuracy': {type(game.get('accuracy'))}")
-        print(f"    Accuracy value: {game.get('accuracy')}")
-        
-        if isinstance(game.get('accuracy'), dict):
-            acc = game['accuracy']
-            print(f"    Overall accuracy: {acc.get('overall_accuracy', 'N/A')}")
-        else:
-            print(f"    (Not a dict, need to debug)")
+        print(f"    Type of 'accuracy': {type(game.accuracy)}")
+        print(f"    Accuracy value: {game.accuracy}")
+        print(f"    Overall accuracy: {game.accuracy.overall_accuracy}")
     
     print("\n" + "="*80)
     
@@ -111,12 +111,10 @@ Rc8+ 31. Kb1 Rc6 32. Bc4 Rc1+ 33. Kxc1 Kc6 34. Nd5 Kc5 35. Nxe7+ Kd5 1-0
     if game_analyses:
         game_data = game_analyses[0]
         print(f"\n  Game analysis accuracy field:")
-        accuracy_field = game_data.get('accuracy', {})
+        accuracy_field = game_data.accuracy
         print(f"    Type: {type(accuracy_field)}")
         print(f"    Value: {accuracy_field}")
-        
-        if isinstance(accuracy_field, dict):
-            print(f"    Overall: {accuracy_field.get('overall_accuracy', 'N/A')}%")
+        print(f"    Overall: {accuracy_field.overall_accuracy}%")
     
     print("\n" + "="*80)
     
@@ -70,10 +70,9 @@ try:
     game_analyses = results.get('game_analyses', [])
     if game_analyses:
         game_result = game_analyses[0]
-        accuracy_dict = game_result.get('accuracy', {})
-        print("  First game accuracy dict: " + str(accuracy_dict))
-        if isinstance(accuracy_dict, dict):
-            print("  Overall accuracy from dict: " + str(accuracy_dict.get('overall_accuracy')) + "%")
+        accuracy = game_result.accuracy
+        print("  First game accuracy: " + str(accuracy))
+        print("  Overall accuracy: " + str(accuracy.overall_accuracy) + "%")
     
     print()
     print("[DONE] Test complete")
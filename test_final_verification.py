@@ -57,7 +57,7 @@ try:
     
     games = results.get('game_analyses', [])
     if games:
-        game = games[0]
+        game = games[0].asdict()
         accuracy = game.get('accuracy', {})
         engine = game.get('engine_pattern', {})
         
@@ -43,7 +43,7 @@ try:
     game_analyses = results.get('game_analyses', [])
     if game_analyses:
         game = game_analyses[0]
-        print(f"Game accuracy: {game.get('accuracy')}")
+        print(f"Game accuracy: {game.accuracy}")
     
     print("\n✓ Test complete!")
     
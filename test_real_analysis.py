@@ -48,15 +48,15 @@ try:
     print(f"\n[GAMES] Individual Game Results")
     for i, game in enumerate(results.get('game_analyses', [])[:3], 1):
         print(f"\n  Game {i}:")
-        print(f"    Accuracy: {game.get('accuracy', {}).get('overall_accuracy', 0):.1f}%")
-        print(f"    Engine Match: {game.get('engine_pattern', {}).get('top_1_match_rate', 0):.1f}%")
-        print(f"    Opponent: {game.get('opponent_elo', 0)} Elo")
-        print(f"    Moves: {game.get('move_count', 0)}")
+        print(f"    Accuracy: {game.accuracy.overall_accuracy:.1f}%")
+        print(f"    Engine Match: {game.engine_pattern.top_1_match_rate:.1f}%")
+        print(f"    Opponent: {game.opponent_elo} Elo")
+        print(f"    Moves: {game.move_count}")
     
     print("\n" + "="*80)
     
     # Check if evaluations worked
-    accuracy_values = [g.get('accuracy', {}).get('overall_accuracy', 0) for g in results.get('game_analyses', [])]
+    accuracy_values = [g.accuracy.overall_accuracy for g in results.get('game_analyses', [])]
     if all(a == 0.0 for a in accuracy_values):
         print("[WARN] All accuracy values are 0.0 - evaluations not being fetched")
         print("  This might be because:")
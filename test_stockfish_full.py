@@ -41,7 +41,7 @@ try:
     
     game_analyses = results.get('game_analyses', [])
     if game_analyses:
-        game = game_analyses[0]
+        game = game_analyses[0].asdict()
         accuracy = game.get('accuracy', {})
         engine = game.get('engine_pattern', {})
         